@@ -23,8 +23,11 @@ import sys
 import os
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.compiler import CircuitCompiler
@@ -146,19 +149,29 @@ def calculate_pair_fidelity(counts: Dict[str, int], n_pairs: int) -> float:
     Expected states: all combinations of 00 and 11 per pair.
     """
     total = sum(counts.values())
-    n_bits = n_pairs * 2
-    
-    # Generate all expected states
-    expected = []
-    for i in range(2**n_pairs):
-        bits = format(i, f'0{n_pairs}b')
-        state = ''.join('00' if b == '0' else '11' for b in bits)
-        expected.append(state)
     
-    fidelity = sum(counts.get(s, 0) for s in expected) / total
+    fidelity = sum(counts.get(s, 0) for s in _pair_states(n_pairs)) / total
     return fidelity
 
 
+@lru_cache(maxsize=8)
+def _state_table(bit_width: int) -> np.ndarray:
+    """All 2^n bitstrings as a (2^n, n) uint8 array, MSB first (read-only)."""
+    # Big-endian, so each row's uint8 view (and unpackbits) runs MSB first
+    arr = np.arange(2**bit_width, dtype='>u8')
+    bits = np.unpackbits(arr.view(np.uint8).reshape(-1, 8), axis=1)[:, 64 - bit_width:]
+    bits.flags.writeable = False
+    return bits
+
+
+@lru_cache(maxsize=8)
+def _pair_states(n_pairs: int) -> Tuple[str, ...]:
+    """Expected states for N Bell pairs: every combination of 00/11 per pair."""
+    # Each pair bit doubles into '00' or '11'
+    chars = np.repeat(_state_table(n_pairs), 2, axis=1) + ord('0')
+    return tuple(chars.view(f'S{n_pairs * 2}').ravel().astype(str).tolist())
+
+
 # =============================================================================
 # MAIN VERIFICATION
 # =============================================================================
@@ -30,6 +30,7 @@ Example:
 from .isa import (
     OpCode,
     Instruction,
+    Program,
     SolitonRegister,
     SolitonHeap,
     TopologyConstants,
@@ -87,6 +88,7 @@ __all__ = [
     # ISA
     "OpCode",
     "Instruction", 
+    "Program",
     "SolitonRegister",
     "SolitonHeap",
     "TopologyConstants",
@@ -0,0 +1,144 @@
+"""
+LockWorks Braid Kernel
+======================
+
+Circuit blocks shared by every witness generation: the portal H layer,
+the (CZ, RX, RZ) × complexity braid and the template build path. Braid
+blocks are cached per (complexity, theta) and composed onto a disk's
+(phase, data) qubit pair.
+"""
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Barrier, CircuitInstruction, Parameter
+from qiskit.circuit.library import CZGate, RXGate, RZGate
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Union
+
+
+# Braid angles of disks A and B, bound per build (shared by all witnesses,
+# so the braid blocks below are too)
+THETA_A = Parameter('theta_a')
+THETA_B = Parameter('theta_b')
+
+# Witness register layout (3 disks × 2 qubits, one bit per data qubit);
+# registers are immutable, so every witness instance shares these
+Q = QuantumRegister(6, 'q')
+C = ClassicalRegister(3, 'meas')
+
+# H on all 6 witness qubits: opens the portal (and seals it in Z-basis)
+PORTAL = QuantumCircuit(6, name='portal')
+PORTAL.h(range(6))
+
+# Witness templates, keyed by witness class + configuration + option set
+_TEMPLATE_CACHE_SIZE = 64
+_templates: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
+
+# Bound witness circuits per full argument set (callers get copies)
+_BOUND_CACHE_SIZE = 256
+_bound: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
+
+
+@lru_cache(maxsize=32)
+def braid_block(complexity: int,
+                theta: Union[float, Parameter],
+                emit_barriers: bool = True) -> QuantumCircuit:
+    """
+    Braid kernel on a 2-qubit (phase, data) circuit, composed onto each disk.
+    
+    With emit_barriers=False the per-iteration barriers are dropped and a
+    single barrier closes the block instead.
+    """
+    block = QuantumCircuit(2)
+    phase_q, data_q = block.qubits
+    pair = (phase_q, data_q)
+    
+    # Theta is fixed for the whole braid: build each instruction once and
+    # replay it through the unchecked _append path
+    cz = CircuitInstruction(CZGate(), pair)
+    rx = CircuitInstruction(RXGate(theta), (phase_q,))
+    rz = CircuitInstruction(RZGate(theta * 2), (data_q,))
+    barrier = CircuitInstruction(Barrier(2), pair)
+    
+    for _ in range(complexity):
+        block._append(cz)
+        block._append(rx)
+        block._append(rz)
+        if emit_barriers:
+            block._append(barrier)
+    
+    if not emit_barriers:
+        block._append(barrier)
+    return block
+
+
+def braid(qc: QuantumCircuit,
+          qreg: QuantumRegister,
+          idx: int,
+          theta: Union[float, Parameter],
+          complexity: int,
+          emit_barriers: bool = True) -> None:
+    """
+    Apply the braid kernel to disk idx of qreg.
+    
+    Args:
+        qc: Circuit to append to
+        qreg: 6-qubit witness register (phase qubits even, data qubits odd)
+        idx: Disk index (0, 1, or 2)
+        theta: Braid angle (0.0 = ROBUST, 0.196 = FISHER) or a Parameter
+        complexity: Braid iterations
+        emit_barriers: Barrier after every iteration instead of once
+    """
+    p = idx * 2      # Phase qubit
+    d = idx * 2 + 1  # Data qubit
+    
+    block = braid_block(complexity, theta, emit_barriers)
+    qc.compose(block, qubits=[qreg[p], qreg[d]], inplace=True)
+
+
+class BraidWitness:
+    """
+    Template build path shared by the witness generations.
+    
+    Only the disk A/B braid angles depend on the data values, so each
+    structural option set ``key`` is built once by the subclass's
+    ``_build_template(*key)`` with THETA_A/THETA_B unbound, then bound per
+    build. Templates and bound circuits are cached at module level by
+    witness class, complexity and emit_barriers, so instances share them.
+    """
+    
+    theta_a = THETA_A
+    theta_b = THETA_B
+    
+    def _bound(self, val_a: int, val_b: int, *key) -> QuantumCircuit:
+        """Cached ``_bind`` result; shared, so callers must copy it."""
+        bound_key = (type(self), self.complexity, self.emit_barriers,
+                     val_a == 1, val_b == 1) + key
+        circuit = _bound.get(bound_key)
+        if circuit is None:
+            circuit = self._bind(val_a, val_b, *key)
+            _bound[bound_key] = circuit
+            if len(_bound) > _BOUND_CACHE_SIZE:
+                _bound.popitem(last=False)
+        else:
+            _bound.move_to_end(bound_key)
+        return circuit
+    
+    def _bind(self, val_a: int, val_b: int, *key) -> QuantumCircuit:
+        """Template for the option set ``key`` with the braid angles bound."""
+        template_key = (type(self), self.complexity, self.emit_barriers) + key
+        template = _templates.get(template_key)
+        if template is None:
+            template = self._build_template(*key)
+            _templates[template_key] = template
+            if len(_templates) > _TEMPLATE_CACHE_SIZE:
+                _templates.popitem(last=False)
+        else:
+            _templates.move_to_end(template_key)
+        
+        # ParityWitness baseline circuits have no data-disk braids, hence
+        # no angles to bind
+        return template.assign_parameters({
+            self.theta_a: 0.196 if val_a == 1 else 0.0,
+            self.theta_b: 0.196 if val_b == 1 else 0.0,
+        }, strict=False)
@@ -13,21 +13,26 @@ Pipeline:
 
 import re
 import logging
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum, auto
+import numpy as np
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from .isa import (
     OpCode,
     Instruction,
+    Program,
     SolitonRegister,
     SolitonHeap,
     TopologyConstants,
     decode_physical_to_logical,
     calculate_dominance,
+    _VALIDATE,
 )
 
 
@@ -207,6 +212,7 @@ class SLangParser:
         self.tokens = tokens
         self.pos = 0
         self.instructions: List[Instruction] = []
+        self._cursor = 0
         self.program_name: str = "Unnamed"
     
     def parse(self) -> Tuple[str, List[Instruction]]:
@@ -216,6 +222,11 @@ class SLangParser:
         Returns:
             Tuple of (program_name, instructions)
         """
+        # Every instruction consumes at least one token, so the token count
+        # bounds the output: pre-size once and trim after parsing.
+        self.instructions = [None] * len(self.tokens)
+        self._cursor = 0
+        
         # Optional program declaration
         if self._check(TokenType.PROGRAM):
             self._parse_program_header()
@@ -224,8 +235,14 @@ class SLangParser:
         while not self._is_at_end():
             self._parse_statement()
         
+        del self.instructions[self._cursor:]
         return self.program_name, self.instructions
     
+    def _emit(self, instr: Instruction) -> None:
+        """Write an instruction at the output cursor."""
+        self.instructions[self._cursor] = instr
+        self._cursor += 1
+    
     def _parse_program_header(self):
         """Parse: program <name>:"""
         self._advance()  # consume 'program'
@@ -254,7 +271,7 @@ class SLangParser:
         name = name_token.value
         
         # Allocation instruction
-        self.instructions.append(Instruction.alloc(name))
+        self._emit(Instruction.alloc(name))
         
         # Check for initialization
         if self._check(TokenType.ASSIGN):
@@ -262,12 +279,12 @@ class SLangParser:
             
             if self._check(TokenType.NUMBER):
                 value = self._advance().value
-                self.instructions.append(Instruction.write(name, value))
+                self._emit(Instruction.write(name, value))
             elif self._check(TokenType.H):
                 self._advance()  # consume 'H'
                 # Superposition - use special metadata
-                instr = Instruction(OpCode.S_WRITE, name, ["H"])
-                self.instructions.append(instr)
+                instr = Instruction(OpCode.S_WRITE, name, ("H",))
+                self._emit(instr)
         
         self._match(TokenType.SEMICOLON)
     
@@ -283,7 +300,7 @@ class SLangParser:
         self._expect(TokenType.RPAREN, "Expected ')'")
         self._match(TokenType.SEMICOLON)
         
-        self.instructions.append(Instruction.cnot(control, target))
+        self._emit(Instruction.cnot(control, target))
     
     def _parse_identifier_statement(self):
         """Parse statements starting with identifier."""
@@ -297,7 +314,7 @@ class SLangParser:
                 self._expect(TokenType.LPAREN, "Expected '('")
                 self._expect(TokenType.RPAREN, "Expected ')'")
                 self._match(TokenType.SEMICOLON)
-                self.instructions.append(Instruction.roll(name))
+                self._emit(Instruction.roll(name))
         
         elif self._check(TokenType.ASSIGN):
             # Assignment: result = measure(...)
@@ -309,9 +326,7 @@ class SLangParser:
                 self._expect(TokenType.RPAREN, "Expected ')'")
                 self._match(TokenType.SEMICOLON)
                 
-                instr = Instruction.measure(target)
-                instr.metadata['result_var'] = name
-                self.instructions.append(instr)
+                self._emit(Instruction.measure(target, name))
     
     # Helper methods
     def _advance(self) -> Token:
@@ -352,14 +367,28 @@ class CircuitCompiler:
         2. Braid Loop (CZ, RX, RZ) × COMPLEXITY
         3. Close Portal (H gates)
         4. Measure
+    
+    With emit_barriers=False the per-iteration braid barriers are dropped and
+    a single barrier closes each register's braid instead (the same contract
+    as Cylinder and the witness braid kernel). The circuit is smaller and
+    faster to build, but the transpiler is then free to fuse (or cancel)
+    layers within a braid at optimization_level >= 2.
     """
     
     def __init__(self, complexity: int = TopologyConstants.COMPLEXITY, 
-                 unsafe: bool = False):
+                 unsafe: bool = False,
+                 emit_barriers: bool = True):
         self.complexity = complexity
         self.unsafe = unsafe
+        self.emit_barriers = emit_barriers
         self.heap = SolitonHeap()
         
+        # One parameterized braid segment, bound per register at compile time.
+        # RZ gets its own parameter so 2θ is computed once per register.
+        self._theta_param = Parameter('θ')
+        self._theta2_param = Parameter('θ2')
+        self._braid_template = self._build_braid_template()
+        
         # Validate complexity
         if complexity < TopologyConstants.COMPLEXITY_MIN and not unsafe:
             logger.warning(
@@ -367,6 +396,21 @@ class CircuitCompiler:
                 "Geometry may break! Use unsafe=True to override."
             )
     
+    def _build_braid_template(self) -> QuantumCircuit:
+        """Build the 2-qubit braid segment (phase=0, data=1) as a θ template."""
+        theta = self._theta_param
+        theta_2 = self._theta2_param
+        tpl = QuantumCircuit(2, name="braid")
+        for _ in range(self.complexity):
+            tpl.cz(0, 1)
+            tpl.rx(theta, 0)
+            tpl.rz(theta_2, 1)
+            if self.emit_barriers:
+                tpl.barrier(0, 1)
+        if not self.emit_barriers:
+            tpl.barrier(0, 1)
+        return tpl
+    
     def compile(self, instructions: List[Instruction]) -> QuantumCircuit:
         """
         Compile instructions to quantum circuit.
@@ -377,32 +421,25 @@ class CircuitCompiler:
         Returns:
             Compiled QuantumCircuit
         """
-        # First pass: allocate all solitons
-        for instr in instructions:
-            if instr.opcode == OpCode.S_ALLOC:
-                self.heap.alloc(instr.target)
-        
-        # Second pass: process writes
-        for instr in instructions:
-            if instr.opcode == OpCode.S_WRITE:
-                reg = self.heap.get(instr.target)
-                value = instr.operands[0]
-                if value == "H":
-                    reg.set_superposition()
-                else:
-                    reg.write(value)
-            elif instr.opcode == OpCode.S_ROLL:
-                reg = self.heap.get(instr.target)
-                reg.roll()
-        
-        # Validate topology
-        warnings = self.heap.validate_topology(self.complexity)
-        for w in warnings:
-            logger.warning(w)
-        
-        # Build circuit
+        # Lower once to the opcode tape; circuit passes below are opcode scans
+        prog = Program.from_instructions(instructions)
+        names = prog.names
+        targets = prog.targets.tolist()
+        op0 = prog.op0.tolist()
+        
+        # Allocate all solitons, then apply writes/rolls in program order
+        prog.run(self.heap)
+        
+        # Validate topology (off under python -O or GAMBIT_VALIDATE=0)
+        if _VALIDATE:
+            warnings = self.heap.validate_topology(self.complexity)
+            for w in warnings:
+                logger.warning(w)
+        
+        # Build circuit (snapshot the heap once; reused by braid and measure)
+        regs = self.heap.get_all()
         n_phys = self.heap.num_physical_qubits
-        n_log = self.heap.num_solitons
+        n_log = len(regs)
         
         if n_phys == 0:
             raise ValueError("No solitons allocated!")
@@ -415,48 +452,44 @@ class CircuitCompiler:
         qc.h(qreg)
         
         # === LAYER 2: BRAID TOPOLOGY ===
-        for reg in self.heap.get_all():
-            p_phase = reg.phase_qubit
-            p_data = reg.data_qubit
-            theta = reg.theta
-            
-            # Clamp theta if not unsafe
-            if not self.unsafe:
-                theta = max(TopologyConstants.THETA_MIN, 
-                           min(theta, TopologyConstants.THETA_MAX))
-            
-            for _ in range(self.complexity):
-                qc.cz(qreg[p_phase], qreg[p_data])
-                qc.rx(theta, qreg[p_phase])
-                qc.rz(theta * 2, qreg[p_data])
-                qc.barrier([qreg[p_phase], qreg[p_data]])
+        # Clamp all thetas in one pass (if not unsafe), hoisted out of the braid
+        thetas = np.array([reg.theta for reg in regs], dtype=np.float64)
+        if not self.unsafe:
+            np.clip(thetas, TopologyConstants.THETA_MIN,
+                    TopologyConstants.THETA_MAX, out=thetas)
+        thetas2 = thetas * 2
+        
+        for i, reg in enumerate(regs):
+            braid = self._braid_template.assign_parameters({
+                self._theta_param: float(thetas[i]),
+                self._theta2_param: float(thetas2[i]),
+            })
+            qc.compose(
+                braid,
+                qubits=[qreg[reg.phase_qubit], qreg[reg.data_qubit]],
+                inplace=True,
+            )
         
         # === LAYER 3: APPLY OPERATIONS (CNOT etc.) ===
-        for instr in instructions:
-            if instr.opcode == OpCode.S_CNOT:
-                control_name = instr.operands[0]
-                target_name = instr.target
-                
-                ctrl_reg = self.heap.get(control_name)
-                tgt_reg = self.heap.get(target_name)
-                
-                # CNOT between DATA bits only
-                qc.cx(qreg[ctrl_reg.data_qubit], qreg[tgt_reg.data_qubit])
+        for i in prog.indices(OpCode.S_CNOT).tolist():
+            ctrl_reg = self.heap.get(names[op0[i]])
+            tgt_reg = self.heap.get(names[targets[i]])
+            
+            # CNOT between DATA bits only
+            qc.cx(qreg[ctrl_reg.data_qubit], qreg[tgt_reg.data_qubit])
         
         # === LAYER 4: CLOSE PORTAL (Hadamard) ===
         qc.h(qreg)
         
         # === LAYER 5: MEASURE DATA BITS ===
-        measure_idx = 0
-        for instr in instructions:
-            if instr.opcode == OpCode.S_MEASURE:
-                reg = self.heap.get(instr.target)
-                qc.measure(qreg[reg.data_qubit], creg[measure_idx])
-                measure_idx += 1
+        measured = prog.indices(OpCode.S_MEASURE).tolist()
+        for measure_idx, i in enumerate(measured):
+            reg = self.heap.get(names[targets[i]])
+            qc.measure(qreg[reg.data_qubit], creg[measure_idx])
         
         # If no explicit measure, measure all
-        if measure_idx == 0:
-            for i, reg in enumerate(self.heap.get_all()):
+        if not measured:
+            for i, reg in enumerate(regs):
                 qc.measure(qreg[reg.data_qubit], creg[i])
         
         return qc
@@ -486,10 +519,12 @@ class GambitCompiler:
     
     def __init__(self, complexity: int = TopologyConstants.COMPLEXITY,
                  unsafe: bool = False,
-                 optimization_level: int = 3):
+                 optimization_level: int = 3,
+                 emit_barriers: bool = True):
         self.complexity = complexity
         self.unsafe = unsafe
         self.optimization_level = optimization_level
+        self.emit_barriers = emit_barriers
         self._circuit_compiler = None
     
     def compile_source(self, source: str) -> Tuple[str, QuantumCircuit]:
@@ -516,21 +551,22 @@ class GambitCompiler:
         # Compile to circuit
         self._circuit_compiler = CircuitCompiler(
             complexity=self.complexity,
-            unsafe=self.unsafe
+            unsafe=self.unsafe,
+            emit_barriers=self.emit_barriers
         )
         circuit = self._circuit_compiler.compile(instructions)
         circuit.name = program_name
         
-        n_phys = self._circuit_compiler.heap.num_physical_qubits
-        n_log = self._circuit_compiler.heap.num_solitons
+        heap = self._circuit_compiler.heap
+        n_phys = heap.num_physical_qubits
+        n_log = heap.num_solitons
         logger.info(f"   Allocated: {n_log} logical ({n_phys} physical) qubits")
         
         return program_name, circuit
     
     def compile_file(self, filepath: str) -> Tuple[str, QuantumCircuit]:
         """Compile S-Lang file to quantum circuit."""
-        with open(filepath, 'r') as f:
-            source = f.read()
+        source = Path(filepath).read_text(encoding='utf-8')
         return self.compile_source(source)
     
     def transpile(self, circuit: QuantumCircuit, backend) -> QuantumCircuit:
@@ -564,6 +600,9 @@ class GambitCompiler:
 # G-ISA ASSEMBLER (Text Assembly Format)
 # =============================================================================
 
+_OPCODE_BY_NAME: Dict[str, OpCode] = {op.name: op for op in OpCode}
+
+
 class GISAAssembler:
     """
     Assembler for G-ISA text format.
@@ -593,9 +632,8 @@ class GISAAssembler:
             
             opcode_str = parts[0].upper()
             
-            try:
-                opcode = OpCode[opcode_str]
-            except KeyError:
+            opcode = _OPCODE_BY_NAME.get(opcode_str)
+            if opcode is None:
                 raise SyntaxError(f"Line {line_num}: Unknown opcode '{opcode_str}'")
             
             if opcode == OpCode.S_ALLOC:
@@ -610,7 +648,7 @@ class GISAAssembler:
                 if isinstance(value, int):
                     instructions.append(Instruction.write(parts[1], value))
                 else:
-                    instructions.append(Instruction(OpCode.S_WRITE, parts[1], [value]))
+                    instructions.append(Instruction(OpCode.S_WRITE, parts[1], (value,)))
             
             elif opcode == OpCode.S_ROLL:
                 if len(parts) < 2:
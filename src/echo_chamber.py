@@ -14,10 +14,28 @@ The Echo is applied AFTER the X-Link but BEFORE the Braid, scrubbing
 the topological noise generated during gearing.
 """
 
+from functools import lru_cache
 from qiskit import QuantumCircuit
+from qiskit.circuit import Instruction
+from qiskit.circuit.library import XGate
 from typing import List, Union
 
 
+@lru_cache(maxsize=32)
+def _idle_block(n_qubits: int, delay_cycles: int) -> Instruction:
+    """delay_cycles identity layers on n_qubits, packed as one instruction."""
+    block = QuantumCircuit(n_qubits, name=f"idle_{delay_cycles}")
+    for _ in range(delay_cycles):
+        block.id(range(n_qubits))
+    return block.to_instruction()
+
+
+def _idle(qc: QuantumCircuit, qubits: List, delay_cycles: int) -> None:
+    """Append a cached identity-wait of delay_cycles on qubits."""
+    if delay_cycles > 0:
+        qc.append(_idle_block(len(qubits), delay_cycles), qubits)
+
+
 class EchoChamber:
     """
     Hahn Spin Echo for phase drift cancellation.
@@ -49,28 +67,22 @@ class EchoChamber:
         """
         # === 1. First Half Evolution (Forward) ===
         qc.barrier(qubits)
-        for _ in range(delay_cycles):
-            for q in qubits:
-                qc.id(q)
+        _idle(qc, qubits, delay_cycles)
         
         # === 2. THE FLIP (X-Pulse) ===
         # Inverts the phase frame: |0⟩ -> |1⟩, |1⟩ -> |0⟩
         # Z-errors become -Z errors relative to original frame
-        for q in qubits:
-            qc.x(q)
+        qc.x(qubits)
         
         # === 3. Second Half Evolution (Backward) ===
         # The drift continues, but now unwinds the error
         qc.barrier(qubits)
-        for _ in range(delay_cycles):
-            for q in qubits:
-                qc.id(q)
+        _idle(qc, qubits, delay_cycles)
         
         # === 4. RESTORE FRAME (Second X-Pulse) ===
         # Return to original basis
         # X·X = I, but the phase evolution has been time-reversed
-        for q in qubits:
-            qc.x(q)
+        qc.x(qubits)
         
         qc.barrier(qubits)
     
@@ -79,41 +91,48 @@ class EchoChamber:
         qc: QuantumCircuit, 
         qubits: List, 
         n_pulses: int = 2,
-        delay_cycles: int = 0
+        delay_cycles: int = 0,
+        fuse: bool = False
     ) -> None:
         """
         Apply CPMG (Carr-Purcell-Meiboom-Gill) sequence.
         
         Multiple π-pulses for better noise suppression.
+        Refocusing pulses carry the label 'cpmg_pi'.
         
         Args:
             qc: The quantum circuit
             qubits: List of qubits
             n_pulses: Number of refocusing pulses (default 2)
             delay_cycles: Delay between pulses
+            fuse: With delay_cycles=0, drop π-pulse pairs (X·X = I) at
+                  build time instead of emitting them between barriers
         """
+        if n_pulses == 0 and delay_cycles == 0:
+            qc.barrier(qubits)
+            return
+        
+        # No delay between pulses: adjacent π-pulse pairs are identity
+        if fuse and delay_cycles == 0:
+            n_pulses %= 2
+        
         qc.barrier(qubits)
         
+        pi_pulse = XGate(label='cpmg_pi')
         for i in range(n_pulses):
             # Delay
-            for _ in range(delay_cycles):
-                for q in qubits:
-                    qc.id(q)
+            _idle(qc, qubits, delay_cycles)
             
             # π-pulse (Y-rotation for CPMG, but X works too)
-            for q in qubits:
-                qc.x(q)
+            qc.append(pi_pulse, [qubits])
             
             qc.barrier(qubits)
         
         # Final delay
-        for _ in range(delay_cycles):
-            for q in qubits:
-                qc.id(q)
+        _idle(qc, qubits, delay_cycles)
         
         # Restore with even number of X gates (they cancel)
         if n_pulses % 2 == 1:
-            for q in qubits:
-                qc.x(q)
+            qc.x(qubits)
         
         qc.barrier(qubits)
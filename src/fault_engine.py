@@ -6,10 +6,22 @@ Simulates environmental 'Torque' by injecting controlled bit-flips.
 Used to prove the Parity Witness is not just 'shaping' but 'protecting'.
 """
 
+from functools import lru_cache
 from qiskit import QuantumCircuit
+from qiskit.circuit import Instruction
 from typing import List, Union
 
 
+@lru_cache(maxsize=32)
+def _baseline_block(depth: int, n_qubits: int) -> Instruction:
+    """depth × (identity layer + barrier) on n_qubits, as one instruction."""
+    block = QuantumCircuit(n_qubits, name=f"baseline_{depth}")
+    for _ in range(depth):
+        block.id(range(n_qubits))
+        block.barrier()
+    return block.to_instruction()
+
+
 class FaultEngine:
     """
     Controlled fault injection for resilience testing.
@@ -77,10 +89,8 @@ class FaultEngine:
             qubits: Qubits to apply identity to
             depth: Number of identity layers
         """
-        for _ in range(depth):
-            for q in qubits:
-                qc.id(q)
-            qc.barrier(qubits)
+        if depth > 0:
+            qc.append(_baseline_block(depth, len(qubits)), qubits)
     
     @staticmethod
     def random_pauli(
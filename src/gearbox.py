@@ -26,6 +26,8 @@ Mechanical Model:
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Barrier, CircuitInstruction
+from qiskit.circuit.library import CXGate
 from typing import Sequence, Union
 
 
@@ -66,17 +68,41 @@ class Gearbox:
         qc.cx(control_q, target_q)
         qc.barrier(control_q, target_q)
     
+    @staticmethod
+    def engage_cold_links(qc: QuantumCircuit, pairs: Sequence) -> None:
+        """
+        Cold-Start engagement for a whole LINK layer.
+        
+        Emits exactly what engage_cold_link does for each pair (barrier, CX,
+        barrier on that pair only), but shares one gate instance per kind and
+        appends through the unchecked _append path, so no per-call argument
+        broadcasting or validation is repeated.
+        
+        Args:
+            qc: The quantum circuit
+            pairs: (control_q, target_q) DATA-qubit pairs of Qubit objects
+                belonging to qc, in link order
+        """
+        barrier = Barrier(2)
+        cx = CXGate()
+        for pair in pairs:
+            pair = tuple(pair)
+            qc._append(CircuitInstruction(barrier, pair))
+            qc._append(CircuitInstruction(cx, pair))
+            qc._append(CircuitInstruction(barrier, pair))
+    
     @staticmethod
     def engage_cold_symmetric(qc: QuantumCircuit, control_q, target_q) -> None:
         """
         Symmetric Cold-Start with bidirectional CX.
         
         Use for maximum entanglement strength.
+        
+        CX(c,t) CX(t,c) CX(c,t) is exactly SWAP(c,t), so it is emitted as a
+        single swap that routing passes can recognise and absorb.
         """
         qc.barrier(control_q, target_q)
-        qc.cx(control_q, target_q)
-        qc.cx(target_q, control_q)
-        qc.cx(control_q, target_q)
+        qc.swap(control_q, target_q)
         qc.barrier(control_q, target_q)
     
     # =========================================================================
@@ -105,14 +131,6 @@ class Gearbox:
     # v1.2 INTERNAL SYNCHRONIZATION (preserved for compatibility)
     # =========================================================================
     
-    @staticmethod
-    def sync_clutch(qc: QuantumCircuit, *qubits) -> None:
-        """Isolates the LINK from braid pulses."""
-        if qubits:
-            qc.barrier(*qubits)
-        else:
-            qc.barrier()
-    
     @staticmethod
     def rev_match(qc: QuantumCircuit, *qubits) -> None:
         """Identity sequence to stabilize phase before engagement."""
@@ -120,13 +138,6 @@ class Gearbox:
             qc.x(q)
             qc.x(q)
     
-    @staticmethod
-    def engage_internal_gear(qc: QuantumCircuit, control_q, target_q) -> None:
-        """
-        v3.0: Uses phase-biased gearing.
-        """
-        Gearbox.shift_biased_gear(qc, control_q, target_q)
-    
     @staticmethod
     def engage_symmetric_gear(qc: QuantumCircuit, control_q, target_q) -> None:
         """v3.0: Symmetric gear with bias on both qubits."""
@@ -146,11 +157,6 @@ class Gearbox:
         """Legacy: Dynamical Decoupling (X-X)."""
         Gearbox.rev_match(qc, *qubits)
     
-    @staticmethod
-    def shift_gear(qc: QuantumCircuit, control_qubit, target_qubit) -> None:
-        """Legacy v1.1: Now uses v3.0 phase bias."""
-        Gearbox.shift_biased_gear(qc, control_qubit, target_qubit)
-    
     @staticmethod
     def double_shift(qc: QuantumCircuit, control_qubit, target_qubit) -> None:
         """Legacy: Now uses v3.0 double bias."""
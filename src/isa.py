@@ -11,9 +11,14 @@ Key Concepts:
     - Transitions use "Soliton Roll" - continuous θ rotation
 """
 
+from bisect import bisect_left
 from enum import Enum, auto
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+import math
+import os
+import warnings
+from typing import List, Optional, Dict, Any, Union, Tuple
 import numpy as np
 
 
@@ -66,6 +71,24 @@ class TopologyConstants:
     GRAY_CODE_THETAS = [0.0, 0.1, 0.196, 0.4]
 
 
+# Decision boundaries between adjacent Gray Code thetas (0.05, 0.148, 0.298)
+_GRAY_MIDPOINTS = tuple(
+    (a + b) / 2
+    for a, b in zip(TopologyConstants.GRAY_CODE_THETAS,
+                    TopologyConstants.GRAY_CODE_THETAS[1:])
+)
+
+# Hot-path aliases (plain module globals instead of a class attribute walk)
+_THETA_MIN = TopologyConstants.THETA_MIN
+_THETA_MAX = TopologyConstants.THETA_MAX
+_THETA_ROBUST = TopologyConstants.THETA_ROBUST
+_THETA_FISHER = TopologyConstants.THETA_FISHER
+
+# Construction/compile-time validation switch. Set GAMBIT_VALIDATE=0 to
+# skip it; python -O always skips it, whatever GAMBIT_VALIDATE says.
+_VALIDATE = __debug__ and os.environ.get('GAMBIT_VALIDATE', '1') != '0'
+
+
 # =============================================================================
 # OPCODES (G-ISA Instruction Set)
 # =============================================================================
@@ -97,21 +120,23 @@ class OpCode(Enum):
 # INSTRUCTION CLASS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Instruction:
     """
     A single G-ISA instruction with operands.
     
+    Instructions are immutable; build variants through the constructors.
+    
     Attributes:
         opcode: The operation to perform
         target: Target soliton name
         operands: Additional operands (value for WRITE, control for CNOT)
-        metadata: Optional metadata for debugging
+        metadata: Optional metadata for debugging (None when empty)
     """
     opcode: OpCode
     target: str
-    operands: List[Any] = field(default_factory=list)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    operands: Tuple[Any, ...] = ()
+    metadata: Optional[Dict[str, Any]] = None
     
     def __str__(self) -> str:
         ops_str = " ".join(str(o) for o in self.operands)
@@ -127,7 +152,7 @@ class Instruction:
         """Create S_WRITE instruction."""
         if value not in (0, 1):
             raise ValueError(f"S_WRITE value must be 0 or 1, got {value}")
-        return cls(OpCode.S_WRITE, target, [value])
+        return cls(OpCode.S_WRITE, target, (value,))
     
     @classmethod
     def roll(cls, target: str) -> "Instruction":
@@ -137,14 +162,126 @@ class Instruction:
     @classmethod
     def cnot(cls, control: str, target: str) -> "Instruction":
         """Create S_CNOT instruction."""
-        return cls(OpCode.S_CNOT, target, [control])
+        return cls(OpCode.S_CNOT, target, (control,))
     
     @classmethod
-    def measure(cls, target: str) -> "Instruction":
+    def measure(cls, target: str, result_var: Optional[str] = None) -> "Instruction":
         """Create S_MEASURE instruction."""
+        if result_var:
+            return cls(OpCode.S_MEASURE, target, metadata={'result_var': result_var})
         return cls(OpCode.S_MEASURE, target)
 
 
+class Program:
+    """
+    Columnar (struct-of-arrays) view of an instruction stream.
+    
+    Passes select instructions with a single array scan, e.g.
+    ``np.flatnonzero(prog.opcodes == OpCode.S_CNOT.value)``, instead of
+    checking ``instr.opcode`` on every Instruction.
+    
+    Attributes:
+        opcodes: OpCode values (int8)
+        targets: Interned target name ids (int32)
+        op0: First operand (int32): write value, interned control id for
+            S_CNOT, SUPERPOSITION for an 'H' write, NO_OPERAND otherwise
+        names: Interned soliton names, indexed by id
+        metadata: Sparse {instruction index: metadata} for the few that carry it
+    """
+    
+    NO_OPERAND = -1
+    SUPERPOSITION = -2
+    
+    def __init__(self, opcodes: np.ndarray, targets: np.ndarray, op0: np.ndarray,
+                 names: List[str], metadata: Dict[int, Dict[str, Any]]):
+        self.opcodes = opcodes
+        self.targets = targets
+        self.op0 = op0
+        self.names = names
+        self.metadata = metadata
+    
+    @classmethod
+    def from_instructions(cls, instructions: List[Instruction]) -> "Program":
+        """Build the columnar form in one pass over the instructions."""
+        n = len(instructions)
+        opcodes = np.empty(n, dtype=np.int8)
+        targets = np.empty(n, dtype=np.int32)
+        op0 = np.full(n, cls.NO_OPERAND, dtype=np.int32)
+        name_pool: Dict[str, int] = {}
+        metadata: Dict[int, Dict[str, Any]] = {}
+        
+        def intern(name: str) -> int:
+            return name_pool.setdefault(name, len(name_pool))
+        
+        for i, instr in enumerate(instructions):
+            opcode = instr.opcode
+            opcodes[i] = opcode.value
+            targets[i] = intern(instr.target)
+            if not instr.operands and opcode in (OpCode.S_CNOT, OpCode.S_WRITE):
+                raise ValueError(f"{opcode.name} {instr.target}: missing operand")
+            if instr.operands:
+                value = instr.operands[0]
+                if opcode == OpCode.S_CNOT:
+                    op0[i] = intern(value)
+                elif opcode == OpCode.S_WRITE:
+                    if value == "H":
+                        op0[i] = cls.SUPERPOSITION
+                    elif isinstance(value, int):
+                        op0[i] = value
+                    else:
+                        raise ValueError(f"Invalid logical value: {value}")
+            if instr.metadata:
+                metadata[i] = instr.metadata
+        
+        return cls(opcodes, targets, op0, list(name_pool), metadata)
+    
+    def indices(self, opcode: OpCode) -> np.ndarray:
+        """Positions of every instruction with the given opcode, in order."""
+        return np.flatnonzero(self.opcodes == opcode.value)
+    
+    def run(self, heap: "SolitonHeap") -> None:
+        """
+        Apply the program's heap effects.
+        
+        All S_ALLOCs run first, then the opcode tape is walked once and each
+        entry is dispatched through _HANDLERS (ops without heap effects,
+        like S_CNOT and S_MEASURE, have no handler and are skipped).
+        """
+        names = self.names
+        targets = self.targets.tolist()
+        
+        for i in self.indices(OpCode.S_ALLOC).tolist():
+            heap.alloc(names[targets[i]])
+        
+        handlers = _HANDLERS
+        for op, target, operand in zip(self.opcodes.tolist(), targets, self.op0.tolist()):
+            handler = handlers.get(op)
+            if handler is not None:
+                handler(heap, names[target], operand)
+    
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+
+def _h_write(heap: "SolitonHeap", name: str, operand: int) -> None:
+    reg = heap.get(name)
+    if operand == Program.SUPERPOSITION:
+        reg.set_superposition()
+    else:
+        reg.write(operand)
+
+
+def _h_roll(heap: "SolitonHeap", name: str, operand: int) -> None:
+    heap.get(name).roll()
+
+
+# Opcode value -> heap handler(heap, target name, op0)
+_HANDLERS = {
+    OpCode.S_WRITE.value: _h_write,
+    OpCode.S_ROLL.value: _h_roll,
+}
+
+
 # =============================================================================
 # SOLITON REGISTER (Logical Qubit)
 # =============================================================================
@@ -168,16 +305,16 @@ class SolitonRegister:
     phys_indices: tuple = field(default_factory=lambda: (0, 1))
     
     def __post_init__(self):
-        self._validate_theta()
+        if _VALIDATE:
+            self._validate_theta()
     
     def _validate_theta(self, warn: bool = True) -> None:
         """Validate theta is in safe range."""
-        if not TopologyConstants.THETA_MIN <= self.theta <= TopologyConstants.THETA_MAX:
+        if not _THETA_MIN <= self.theta <= _THETA_MAX:
             if warn:
-                import warnings
                 warnings.warn(
                     f"Theta {self.theta} outside safe range "
-                    f"[{TopologyConstants.THETA_MIN}, {TopologyConstants.THETA_MAX}]"
+                    f"[{_THETA_MIN}, {_THETA_MAX}]"
                 )
     
     @property
@@ -193,9 +330,9 @@ class SolitonRegister:
     @property
     def logical_state(self) -> int:
         """Expected logical state based on current theta."""
-        if np.isclose(self.theta, TopologyConstants.THETA_ROBUST, atol=0.05):
+        if abs(self.theta - _THETA_ROBUST) <= 0.05:
             return 0
-        elif np.isclose(self.theta, TopologyConstants.THETA_FISHER, atol=0.05):
+        elif abs(self.theta - _THETA_FISHER) <= 0.05:
             return 1
         else:
             return -1  # Superposition or intermediate
@@ -208,9 +345,9 @@ class SolitonRegister:
             value: 0 for ROBUST, 1 for FISHER
         """
         if value == 0:
-            self.theta = TopologyConstants.THETA_ROBUST
+            self.theta = _THETA_ROBUST
         elif value == 1:
-            self.theta = TopologyConstants.THETA_FISHER
+            self.theta = _THETA_FISHER
         else:
             raise ValueError(f"Invalid logical value: {value}")
     
@@ -220,10 +357,10 @@ class SolitonRegister:
         
         Continuously rotates θ across the phase transition.
         """
-        if np.isclose(self.theta, TopologyConstants.THETA_ROBUST, atol=0.05):
-            self.theta = TopologyConstants.THETA_FISHER
+        if abs(self.theta - _THETA_ROBUST) <= 0.05:
+            self.theta = _THETA_FISHER
         else:
-            self.theta = TopologyConstants.THETA_ROBUST
+            self.theta = _THETA_ROBUST
     
     def set_superposition(self) -> None:
         """Set to edge/superposition state (θ = 0.1)."""
@@ -231,9 +368,8 @@ class SolitonRegister:
     
     def to_gray_level(self) -> int:
         """Convert current theta to Gray Code level (0-3)."""
-        thetas = TopologyConstants.GRAY_CODE_THETAS
-        distances = [abs(self.theta - t) for t in thetas]
-        return distances.index(min(distances))
+        # Nearest level; a theta exactly on a midpoint snaps to the lower one
+        return bisect_left(_GRAY_MIDPOINTS, self.theta)
 
 
 # =============================================================================
@@ -273,8 +409,8 @@ class SolitonHeap:
         self._next_phys_idx += 2
         
         # Create register with initial state
-        theta = (TopologyConstants.THETA_ROBUST if initial_value == 0 
-                 else TopologyConstants.THETA_FISHER)
+        theta = (_THETA_ROBUST if initial_value == 0 
+                 else _THETA_FISHER)
         
         reg = SolitonRegister(name=name, theta=theta, phys_indices=phys_indices)
         self._heap[name] = reg
@@ -308,21 +444,26 @@ class SolitonHeap:
         Returns:
             List of warning messages
         """
-        warnings = []
+        issues = []
         
         if complexity < TopologyConstants.COMPLEXITY_MIN:
-            warnings.append(
+            issues.append(
                 f"⚠️ Complexity {complexity} < {TopologyConstants.COMPLEXITY_MIN}: "
                 "Geometry may break!"
             )
         
-        for name, reg in self._heap.items():
-            if not (TopologyConstants.THETA_MIN <= reg.theta <= TopologyConstants.THETA_MAX):
-                warnings.append(
-                    f"⚠️ Soliton '{name}' theta={reg.theta:.3f} outside safe range"
-                )
+        # Registers stay the source of truth for theta (roll/write mutate them
+        # in place), so gather once and range-check in a single vector pass
+        regs = list(self._heap.values())
+        thetas = np.fromiter((r.theta for r in regs), dtype=np.float64, count=len(regs))
+        bad = (thetas < _THETA_MIN) | (thetas > _THETA_MAX)
+        for i in np.flatnonzero(bad):
+            reg = regs[i]
+            issues.append(
+                f"⚠️ Soliton '{reg.name}' theta={reg.theta:.3f} outside safe range"
+            )
         
-        return warnings
+        return issues
     
     def __contains__(self, name: str) -> bool:
         return name in self._heap
@@ -342,6 +483,15 @@ def to_gray(n: int) -> int:
 
 def from_gray(gray: int) -> int:
     """Convert Gray Code to integer."""
+    if gray < (1 << 32):
+        # Parallel prefix XOR: constant 5 steps for any 32-bit word
+        gray ^= gray >> 16
+        gray ^= gray >> 8
+        gray ^= gray >> 4
+        gray ^= gray >> 2
+        gray ^= gray >> 1
+        return gray
+    
     n = gray
     mask = gray >> 1
     while mask:
@@ -350,6 +500,21 @@ def from_gray(gray: int) -> int:
     return n
 
 
+# Gray code ensures only 1 bit changes per step
+# Sequence: 0 (00) → 1 (01) → 3 (11) → 2 (10)
+_GRAY_SEQUENCE = (0, 1, 3, 2)
+
+# All 16 (from, to) transition paths, built once at import
+_GRAY_PATHS: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+for _i, _a in enumerate(_GRAY_SEQUENCE):
+    for _j, _b in enumerate(_GRAY_SEQUENCE):
+        _GRAY_PATHS[(_a, _b)] = (
+            _GRAY_SEQUENCE[_i:_j + 1] if _i <= _j
+            else _GRAY_SEQUENCE[_i:] + _GRAY_SEQUENCE[:_j + 1]
+        )
+del _i, _a, _j, _b
+
+
 def gray_code_transition(from_level: int, to_level: int) -> List[int]:
     """
     Get the safe Gray Code transition path between two levels.
@@ -364,23 +529,24 @@ def gray_code_transition(from_level: int, to_level: int) -> List[int]:
     if from_level == to_level:
         return [from_level]
     
-    # Gray code ensures only 1 bit changes per step
-    # Sequence: 0 (00) → 1 (01) → 3 (11) → 2 (10)
-    sequence = [0, 1, 3, 2]
-    
-    from_idx = sequence.index(from_level)
-    to_idx = sequence.index(to_level)
-    
-    if from_idx <= to_idx:
-        return sequence[from_idx:to_idx + 1]
-    else:
-        return sequence[from_idx:] + sequence[:to_idx + 1]
+    try:
+        return list(_GRAY_PATHS[(from_level, to_level)])
+    except KeyError:
+        raise ValueError(
+            f"Gray Code levels must be 0-3, got {from_level} -> {to_level}"
+        ) from None
 
 
 # =============================================================================
 # RESULT DECODING
 # =============================================================================
 
+# The data bit (second position when reading left-to-right) determines logic
+# But Qiskit uses little-endian, so the first character decides
+_PHYS2LOG = {'00': 0, '01': 0, '10': 1, '11': 1}
+_PHYS2LOG_LUT = np.array([0, 0, 1, 1], dtype=np.uint8)
+
+
 def decode_physical_to_logical(physical_state: str) -> int:
     """
     Decode physical measurement to logical state.
@@ -395,30 +561,49 @@ def decode_physical_to_logical(physical_state: str) -> int:
     Returns:
         Logical bit value (0 or 1)
     """
-    if len(physical_state) != 2:
-        raise ValueError(f"Expected 2-bit state, got '{physical_state}'")
+    try:
+        return _PHYS2LOG[physical_state]
+    except KeyError:
+        raise ValueError(f"Expected 2-bit state, got '{physical_state}'") from None
+
+
+def decode_many(states: np.ndarray) -> np.ndarray:
+    """
+    Bulk version of decode_physical_to_logical.
     
-    # The data bit (second position when reading left-to-right) determines logic
-    # But Qiskit uses little-endian, so we check the first character
-    return 1 if physical_state[0] == '1' else 0
+    Args:
+        states: Integer-encoded 2-bit states (int('10', 2) == 2, etc.)
+        
+    Returns:
+        uint8 array of logical bit values
+    """
+    return _PHYS2LOG_LUT[states]
 
 
-def calculate_dominance(counts: Dict[str, int]) -> tuple:
+def calculate_dominance(counts: Dict[str, int],
+                        total: Optional[int] = None) -> tuple:
     """
     Calculate dominance score from measurement counts.
     
     Args:
         counts: Dictionary of {state: count}
+        total: Total shot count if already known (e.g. Sampler shots)
         
     Returns:
         Tuple of (dominance_score, top_state, is_decohered)
     """
-    total = sum(counts.values())
+    if not counts:
+        return 0.0, "??", True
+    
+    vals = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    if total is None:
+        total = int(vals.sum())
     if total == 0:
         return 0.0, "??", True
     
-    sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    top_state, top_count = sorted_counts[0]
+    idx = int(vals.argmax())  # first maximum, in insertion order
+    top_state = next(islice(counts, idx, None))
+    top_count = int(vals[idx])
     dominance = top_count / total
     
     is_decohered = dominance < TopologyConstants.DOMINANCE_THRESHOLD
@@ -426,6 +611,11 @@ def calculate_dominance(counts: Dict[str, int]) -> tuple:
     return dominance, top_state, is_decohered
 
 
+_INV_SQRT2 = 1 / math.sqrt(2)
+
+
 def hellinger_distance(p: np.ndarray, q: np.ndarray) -> float:
     """Calculate Hellinger distance between two probability distributions."""
-    return (1 / np.sqrt(2)) * np.linalg.norm(np.sqrt(p) - np.sqrt(q))
+    d = np.sqrt(p)
+    d -= np.sqrt(q)
+    return float(np.sqrt(np.vdot(d, d))) * _INV_SQRT2
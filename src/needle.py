@@ -8,15 +8,21 @@ The "Needle" is the measurement probe that reads disk positions.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
+import numpy as np
 
 from qiskit import QuantumCircuit
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+# qiskit_ibm_runtime and the preset pass managers are imported where they are
+# used, so local/simulation users never pay their import cost
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import QiskitRuntimeService
 
 from .cylinder import Cylinder, UnitCell
 from .isa import TopologyConstants
+from .runtime import transpile_cached
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -81,9 +87,10 @@ class NeedleDriver:
         self.backend_name = backend_name
         self.shots = shots
         
-        self.service: Optional[QiskitRuntimeService] = None
+        self.service: Optional["QiskitRuntimeService"] = None
         self.backend = None
         self._connected = False
+        self._isa_cache: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
     
     def connect(self) -> None:
         """Connect to IBM Quantum service."""
@@ -109,6 +116,7 @@ class NeedleDriver:
             raise ValueError("No IBM credentials found")
         
         logger.info("🔌 Connecting needle to IBM Quantum...")
+        from qiskit_ibm_runtime import QiskitRuntimeService
         self.service = QiskitRuntimeService(token=token)
         
         if self.backend_name:
@@ -132,53 +140,12 @@ class NeedleDriver:
         Returns:
             NeedleResult with measured values
         """
-        if not self._connected:
-            self.connect()
-        
         addresses = addresses or list(range(cylinder.n_disks))
         
         # Generate circuit
         circuit = cylinder.to_circuit(measurements=addresses)
         
-        # Transpile for hardware
-        logger.info(f"🔨 Transpiling for {self.backend.name}...")
-        pm = generate_preset_pass_manager(
-            backend=self.backend,
-            optimization_level=3
-        )
-        isa_circuit = pm.run(circuit)
-        
-        # Execute
-        logger.info(f"📖 Reading {len(addresses)} disk(s)...")
-        sampler = Sampler(mode=self.backend)
-        pub = (isa_circuit, None, self.shots)
-        
-        job = sampler.run([pub])
-        job_id = job.job_id()
-        logger.info(f"   Job ID: {job_id}")
-        
-        logger.info("   ... Waiting for needle read ...")
-        result = job.result()
-        
-        # Extract counts
-        pub_result = result[0]
-        try:
-            counts = pub_result.data.meas.get_counts()
-        except:
-            counts = {}
-        
-        # Decode values
-        values, fidelity = self._decode_counts(counts, len(addresses))
-        
-        logger.info(f"✅ Read complete: {values}")
-        
-        return NeedleResult(
-            addresses=addresses,
-            values=values,
-            raw_counts=counts,
-            fidelity=fidelity,
-            job_id=job_id
-        )
+        return self._run_batch([circuit], [addresses])[0]
     
     def read_circuit(self, circuit: QuantumCircuit) -> NeedleResult:
         """
@@ -192,49 +159,68 @@ class NeedleDriver:
         Returns:
             NeedleResult with measured values
         """
+        return self.read_batch([circuit])[0]
+    
+    def read_batch(self, circuits: List[QuantumCircuit]) -> List[NeedleResult]:
+        """
+        Execute several pre-built circuits as a single Sampler job.
+        
+        Args:
+            circuits: Pre-built QuantumCircuits with measurements
+            
+        Returns:
+            One NeedleResult per circuit, in order
+        """
+        return self._run_batch(
+            circuits, [list(range(c.num_clbits)) for c in circuits]
+        )
+    
+    def _run_batch(self,
+                   circuits: List[QuantumCircuit],
+                   addresses: List[List[int]]) -> List[NeedleResult]:
+        """Transpile all circuits, submit them as one job and decode each PUB."""
         if not self._connected:
             self.connect()
         
-        # Transpile for hardware
-        logger.info(f"🔨 Transpiling for {self.backend.name}...")
-        pm = generate_preset_pass_manager(
-            backend=self.backend,
-            optimization_level=3
-        )
-        isa_circuit = pm.run(circuit)
+        # Transpile for hardware, reusing cached ISA circuits for repeat structures
+        # (same bounded LRU as GambitExecutionManager)
+        logger.info(f"🔨 Transpiling {len(circuits)} circuit(s) for {self.backend.name}...")
+        isa_circuits = transpile_cached(self._isa_cache, self.backend, circuits, 3)
         
         # Execute
-        n_classical = circuit.num_clbits
-        logger.info(f"📖 Reading {n_classical} bit(s)...")
+        logger.info(f"📖 Reading {sum(map(len, addresses))} bit(s)...")
+        from qiskit_ibm_runtime import SamplerV2 as Sampler
         sampler = Sampler(mode=self.backend)
-        pub = (isa_circuit, None, self.shots)
         
-        job = sampler.run([pub])
+        job = sampler.run([(c, None, self.shots) for c in isa_circuits])
         job_id = job.job_id()
         logger.info(f"   Job ID: {job_id}")
         
         logger.info("   ... Waiting for needle read ...")
         result = job.result()
         
-        # Extract counts
-        pub_result = result[0]
-        try:
-            counts = pub_result.data.meas.get_counts()
-        except:
-            counts = {}
-        
-        # Decode values
-        values, fidelity = self._decode_counts(counts, n_classical)
-        
-        logger.info(f"✅ Read complete: {values}")
-        
-        return NeedleResult(
-            addresses=list(range(n_classical)),
-            values=values,
-            raw_counts=counts,
-            fidelity=fidelity,
-            job_id=job_id
-        )
+        results = []
+        for pub_result, addrs in zip(result, addresses):
+            # Extract counts
+            try:
+                counts = pub_result.data.meas.get_counts()
+            except:
+                counts = {}
+            
+            # Decode values
+            values, fidelity = self._decode_counts(counts, len(addrs))
+            
+            logger.info(f"✅ Read complete: {values}")
+            
+            results.append(NeedleResult(
+                addresses=addrs,
+                values=values,
+                raw_counts=counts,
+                fidelity=fidelity,
+                job_id=job_id
+            ))
+        
+        return results
     
     def _decode_counts(self, 
                        counts: Dict[str, int], 
@@ -244,35 +230,34 @@ class NeedleDriver:
         
         Uses majority voting to determine each disk's value.
         """
-        total = sum(counts.values())
+        vals = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        total = int(vals.sum())
         if total == 0:
             return [0] * n_disks, 0.0
-        
-        # Count votes for each disk position
-        votes = [{0: 0, 1: 0} for _ in range(n_disks)]
-        
-        for bitstring, count in counts.items():
-            # Pad bitstring if needed
-            bits = bitstring.zfill(n_disks)
-            
-            for i, bit in enumerate(reversed(bits)):
-                votes[i][int(bit)] += count
-        
-        # Majority vote
-        values = []
-        confidences = []
-        
-        for vote in votes:
-            if vote[0] >= vote[1]:
-                values.append(0)
-                confidences.append(vote[0] / (vote[0] + vote[1]))
-            else:
-                values.append(1)
-                confidences.append(vote[1] / (vote[0] + vote[1]))
-        
-        avg_fidelity = sum(confidences) / len(confidences) if confidences else 0.0
-        
-        return values, avg_fidelity
+        if n_disks == 0:
+            return [], 0.0
+        
+        # (n_states, width) bit matrix, little-endian so column i is disk i
+        lengths = set(map(len, counts))
+        if len(lengths) == 1 and n_disks <= next(iter(lengths)):
+            # Sampler bitstrings are already full width: join them as-is
+            width = lengths.pop()
+            raw = "".join(counts).encode("ascii")
+            codes = np.frombuffer(raw, dtype=np.uint8).reshape(len(counts), width)
+        else:
+            # Pad all keys in one vectorized call, then read the UCS4 code points
+            width = max(n_disks, max(lengths))
+            padded = np.char.zfill(np.array(list(counts), dtype=f"U{width}"), width)
+            codes = padded.astype(f"U{width}").view(np.uint32).reshape(len(counts), width)
+        bits = (codes[:, ::-1][:, :n_disks] - 0x30).astype(np.int64)
+        
+        # Majority vote (ties read as 0)
+        ones = bits.T @ vals
+        zeros = total - ones
+        values = (ones > zeros).astype(int).tolist()
+        confidences = np.maximum(ones, zeros) / total
+        
+        return values, float(confidences.mean())
     
     def write_and_read(self,
                        cylinder: Cylinder,
@@ -13,27 +13,175 @@ Features:
 
 import os
 import json
+import math
+import time
+import asyncio
 import logging
+import threading
+import hashlib
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 import numpy as np
 
 from qiskit import QuantumCircuit
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+# qiskit_ibm_runtime and the preset pass managers are imported where they are
+# used, so local/simulation users never pay their import cost
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import QiskitRuntimeService
 
 from .isa import (
     TopologyConstants,
     decode_physical_to_logical,
     calculate_dominance,
-    hellinger_distance,
 )
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+# Transpiled circuits kept per GambitExecutionManager / NeedleDriver
+_ISA_CACHE_SIZE = 64
+
+# Preset pass managers shared by every manager/driver in the process,
+# keyed by (backend fingerprint, optimization level)
+_PM_CACHE_SIZE = 8
+_PM_CACHE: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+_PM_LOCK = threading.Lock()
+
+# Backend object -> (fingerprint, Target it was computed from)
+_FINGERPRINTS: "weakref.WeakKeyDictionary[Any, Tuple[str, Any]]" = weakref.WeakKeyDictionary()
+
+# Classical register names tried, in order, when pulling counts from a result
+_COUNT_ATTRS = ('meas', 'c', 'cr', 'creg')
+
+
+@lru_cache(maxsize=64)
+def _uniform_constants(num_states: int) -> Tuple[float, float, float]:
+    """sqrt(1/N) and the (clamped) null-distribution mean/std for N states."""
+    # Null constants are for 2-qubit, scale for others
+    null_mean = 0.008 * (4 / num_states)
+    null_std = max(0.0037 * (4 / num_states), 0.001)
+    return math.sqrt(1 / num_states), null_mean, null_std
+
+
+def _decode_logical(state: str) -> List[int]:
+    """
+    Logical values of a measured bitstring.
+    
+    Each logical qubit is a (data, phase) pair whose first bit decides, and
+    an odd trailing bit is read as-is - i.e. every even-position bit.
+    """
+    lead_bits = np.frombuffer(state[::2].encode("ascii"), dtype=np.uint8)
+    return (lead_bits == ord('1')).astype(int).tolist()
+
+
+def backend_fingerprint(backend) -> str:
+    """
+    Cache-key digest of a backend's class, name, version and Target.
+    
+    Names alone are not unique (fake/aer backends share them) and go stale
+    when the device is recalibrated, so the digest covers every instruction,
+    its qargs and their error/duration. It is memoized per backend object
+    and recomputed when the backend hands out a new Target.
+    """
+    target = backend.target
+    with _PM_LOCK:
+        entry = _FINGERPRINTS.get(backend)
+        if entry is not None and entry[1] is target:
+            return entry[0]
+    h = hashlib.sha256(repr((
+        type(backend).__qualname__,
+        backend.name,
+        getattr(backend, 'backend_version', None),
+        target.num_qubits,
+    )).encode())
+    for name in sorted(target.operation_names):
+        for qargs, props in sorted(target[name].items(), key=lambda kv: repr(kv[0])):
+            h.update(repr((
+                name, qargs,
+                getattr(props, 'error', None), getattr(props, 'duration', None)
+            )).encode())
+    digest = h.hexdigest()
+    with _PM_LOCK:
+        _FINGERPRINTS[backend] = (digest, target)
+    return digest
+
+
+def preset_pass_manager(backend, optimization_level: int):
+    """Preset pass manager for a backend, built once per process (bounded LRU)."""
+    key = (backend_fingerprint(backend), optimization_level)
+    with _PM_LOCK:
+        pm = _PM_CACHE.get(key)
+        if pm is None:
+            from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+            pm = _PM_CACHE[key] = generate_preset_pass_manager(
+                backend=backend,
+                optimization_level=optimization_level
+            )
+            if len(_PM_CACHE) > _PM_CACHE_SIZE:
+                _PM_CACHE.popitem(last=False)
+        else:
+            _PM_CACHE.move_to_end(key)
+    return pm
+
+
+def transpile_cached(cache: "OrderedDict[tuple, QuantumCircuit]",
+                     backend,
+                     circuits: List[QuantumCircuit],
+                     optimization_level: int) -> List[QuantumCircuit]:
+    """
+    Transpile circuits for backend, reusing ISA circuits for repeat structures.
+    
+    ``cache`` is the caller's LRU (at most _ISA_CACHE_SIZE entries), keyed by
+    backend fingerprint, optimization level and circuit_structure_key; only
+    misses go through the shared pass manager, in a single run.
+    """
+    pm_key = (backend_fingerprint(backend), optimization_level)
+    keys = [pm_key + (circuit_structure_key(c),) for c in circuits]
+    misses = {k: c for k, c in zip(keys, circuits) if k not in cache}
+    if misses:
+        pm = preset_pass_manager(backend, optimization_level)
+        cache.update(zip(misses, pm.run(list(misses.values()))))
+    
+    isa_circuits = []
+    for k in keys:
+        cache.move_to_end(k)
+        isa_circuits.append(cache[k])
+    while len(cache) > _ISA_CACHE_SIZE:
+        cache.popitem(last=False)
+    return isa_circuits
+
+
+def _extract_counts(pub_result) -> Optional[Dict[str, int]]:
+    """Counts of a SamplerV2 pub result, or None if no _COUNT_ATTRS register."""
+    data = pub_result.data
+    for name in _COUNT_ATTRS:
+        reg = getattr(data, name, None)
+        if reg is not None:
+            return reg.get_counts()
+    return None
+
+
+def circuit_structure_key(circuit: QuantumCircuit) -> tuple:
+    """Hashable (gate, qubits, clbits, params) fingerprint of a circuit."""
+    find_bit = circuit.find_bit
+    header = (circuit.num_qubits, tuple((r.name, r.size) for r in circuit.cregs))
+    return header + tuple(
+        (
+            inst.operation.name,
+            tuple(find_bit(q).index for q in inst.qubits),
+            tuple(find_bit(c).index for c in inst.clbits),
+            tuple(map(str, inst.operation.params)),
+        )
+        for inst in circuit.data
+    )
+
 
 # =============================================================================
 # RESULT CONTAINER
@@ -160,13 +308,19 @@ class GambitExecutionManager:
     def __init__(self, 
                  api_key: Optional[str] = None,
                  backend_name: Optional[str] = None,
-                 shots: int = TopologyConstants.SHOTS):
+                 shots: int = TopologyConstants.SHOTS,
+                 polling_interval_ms: Optional[int] = None):
         self.cred_manager = CredentialManager(api_key)
         self.backend_name = backend_name
         self.shots = shots
-        self.service: Optional[QiskitRuntimeService] = None
+        # Job status poll period; None picks 100 ms (simulator) / 1 s (hardware)
+        self.polling_interval_ms = polling_interval_ms
+        self._poll = 1.0
+        self.service: Optional["QiskitRuntimeService"] = None
         self.backend = None
         self._is_connected = False
+        self._isa_cache: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
+        self._sampler = None
     
     def connect(self) -> None:
         """Connect to IBM Quantum service."""
@@ -176,6 +330,7 @@ class GambitExecutionManager:
         token = self.cred_manager.load_credentials()
         logger.info("🔌 Connecting to IBM Quantum...")
         
+        from qiskit_ibm_runtime import QiskitRuntimeService
         self.service = QiskitRuntimeService(token=token)
         
         if self.backend_name:
@@ -185,8 +340,63 @@ class GambitExecutionManager:
             self.backend = self.service.least_busy(operational=True, simulator=False)
             logger.info(f"🚀 Auto-selected: {self.backend.name} (least busy)")
         
+        if self.polling_interval_ms is not None:
+            self._poll = self.polling_interval_ms / 1000
+        else:
+            try:
+                simulator = self.backend.configuration().simulator
+            except Exception:
+                simulator = False
+            self._poll = 0.1 if simulator else 1.0
+        
         self._is_connected = True
     
+    def _get_sampler(self):
+        """The manager's Sampler, built on first use and kept across runs."""
+        if self._sampler is None:
+            from qiskit_ibm_runtime import SamplerV2 as Sampler
+            self._sampler = Sampler(mode=self.backend)
+        return self._sampler
+    
+    @contextmanager
+    def session(self, max_time=None):
+        """
+        Run jobs inside one Runtime session.
+        
+        Within the block, run/run_batch/run_many submit through a Sampler
+        bound to the session, so jobs after the first skip the queue.
+        Sessions need a paid (non-Open) plan.
+        
+        Example:
+            >>> with manager.session():
+            ...     results = [manager.run(c) for c in circuits]
+        """
+        if not self._is_connected:
+            self.connect()
+        
+        from qiskit_ibm_runtime import Session, SamplerV2 as Sampler
+        outer = self._sampler
+        # Restore the outer sampler whatever fails: the block, Sampler
+        # construction, or Session.__exit__ closing the session
+        try:
+            with Session(backend=self.backend, max_time=max_time) as sess:
+                self._sampler = Sampler(mode=sess)
+                yield sess
+        finally:
+            self._sampler = outer
+    
+    def _await_job(self, job):
+        """Poll the job at the configured interval until final, then fetch its result."""
+        while not job.in_final_state():
+            time.sleep(self._poll)
+        return job.result()
+    
+    def _transpile(self,
+                   circuits: List[QuantumCircuit],
+                   optimization_level: int) -> List[QuantumCircuit]:
+        """Transpile with a cached pass manager, reusing ISA circuits for repeat structures."""
+        return transpile_cached(self._isa_cache, self.backend, circuits, optimization_level)
+    
     def run(self, 
             circuit: QuantumCircuit,
             shots: Optional[int] = None,
@@ -209,15 +419,11 @@ class GambitExecutionManager:
         
         # Transpile
         logger.info(f"🔨 Transpiling for {self.backend.name}...")
-        pm = generate_preset_pass_manager(
-            backend=self.backend,
-            optimization_level=optimization_level
-        )
-        isa_circuit = pm.run(circuit)
+        isa_circuit = self._transpile([circuit], optimization_level)[0]
         
         # Execute
         logger.info(f"🚀 Submitting job ({shots} shots)...")
-        sampler = Sampler(mode=self.backend)
+        sampler = self._get_sampler()
         pub = (isa_circuit, None, shots)
         
         job = sampler.run([pub])
@@ -225,26 +431,15 @@ class GambitExecutionManager:
         logger.info(f"   → JOB ID: {job_id}")
         
         logger.info("   ... Waiting for execution ...")
-        result = job.result()
+        result = self._await_job(job)
         logger.info("✅ Execution complete!")
         
         # Extract counts
         pub_result = result[0]
         
-        # Handle different result formats
-        try:
-            counts = pub_result.data.meas.get_counts()
-        except AttributeError:
-            # Try other common attribute names
-            for attr in dir(pub_result.data):
-                if not attr.startswith('_'):
-                    try:
-                        counts = getattr(pub_result.data, attr).get_counts()
-                        break
-                    except:
-                        continue
-            else:
-                raise RuntimeError("Could not extract counts from result")
+        counts = _extract_counts(pub_result)
+        if counts is None:
+            raise RuntimeError("Could not extract counts from result")
         
         # Analyze
         return self._analyze_result(counts, shots, job_id)
@@ -271,85 +466,128 @@ class GambitExecutionManager:
         
         # Transpile all
         logger.info(f"🔨 Transpiling {len(circuits)} circuits...")
-        pm = generate_preset_pass_manager(
-            backend=self.backend,
-            optimization_level=optimization_level
-        )
-        isa_circuits = pm.run(circuits)
+        isa_circuits = self._transpile(circuits, optimization_level)
         
         # Create PUBs
         pubs = [(c, None, shots) for c in isa_circuits]
         
         # Execute
         logger.info(f"🚀 Submitting batch ({len(pubs)} circuits, {shots} shots each)...")
-        sampler = Sampler(mode=self.backend)
+        sampler = self._get_sampler()
         job = sampler.run(pubs)
         job_id = job.job_id()
         logger.info(f"   → JOB ID: {job_id}")
         
         logger.info("   ... Waiting for batch execution ...")
-        result = job.result()
+        result = self._await_job(job)
         logger.info("✅ Batch complete!")
         
         # Analyze each result
         results = []
         for pub_result in result:
-            try:
-                counts = pub_result.data.meas.get_counts()
-            except:
-                counts = {}
+            counts = _extract_counts(pub_result) or {}
             results.append(self._analyze_result(counts, shots, job_id))
         
         return results
     
+    async def run_many(self,
+                       circuits: List[QuantumCircuit],
+                       shots: Optional[int] = None,
+                       optimization_level: int = 3,
+                       num_workers: int = 4) -> List[GambitResult]:
+        """
+        Run circuits as separate jobs through a pool of async workers.
+        
+        Each worker submits a job, awaits it without blocking the others and
+        analyzes its counts, so result processing overlaps with jobs still
+        queued or running on the backend.
+        
+        Args:
+            circuits: List of quantum circuits
+            shots: Number of shots per circuit
+            optimization_level: Transpiler optimization
+            num_workers: Jobs kept in flight at once
+            
+        Returns:
+            List of GambitResult objects, in input order
+        """
+        if not self._is_connected:
+            self.connect()
+        
+        shots = shots or self.shots
+        
+        logger.info(f"🔨 Transpiling {len(circuits)} circuits...")
+        isa_circuits = self._transpile(circuits, optimization_level)
+        
+        sampler = self._get_sampler()
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(isa_circuits):
+            queue.put_nowait(item)
+        results: List[Optional[GambitResult]] = [None] * len(isa_circuits)
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    idx, isa_circuit = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                job = await asyncio.to_thread(sampler.run, [(isa_circuit, None, shots)])
+                job_id = job.job_id()
+                logger.info(f"   → JOB ID: {job_id} (circuit {idx})")
+                
+                result = await self._await_job_async(job)
+                counts = _extract_counts(result[0]) or {}
+                results[idx] = self._analyze_result(counts, shots, job_id)
+        
+        logger.info(f"🚀 Submitting {len(isa_circuits)} jobs ({num_workers} workers)...")
+        await asyncio.gather(*(worker() for _ in range(max(1, num_workers))))
+        logger.info("✅ All jobs complete!")
+        
+        return results
+    
+    async def _await_job_async(self, job):
+        """Async counterpart of _await_job: yields to other workers between polls."""
+        while not await asyncio.to_thread(job.in_final_state):
+            await asyncio.sleep(self._poll)
+        return await asyncio.to_thread(job.result)
+    
     def _analyze_result(self, 
                         counts: Dict[str, int], 
                         shots: int,
                         job_id: str = "") -> GambitResult:
         """Analyze measurement counts and create result."""
         # Dominance calculation
-        dominance, top_state, is_decohered = calculate_dominance(counts)
-        
-        # Decode logical values - handle variable bit widths
-        logical_values = []
-        for state in sorted(counts.keys()):
-            # For multi-qubit, decode each pair of bits
-            # For single bit, just use the bit value
-            if len(state) >= 2:
-                # Decode pairs (each logical qubit = 2 physical)
-                for i in range(0, len(state), 2):
-                    if i + 1 < len(state):
-                        pair = state[i:i+2]
-                        logical_values.append(1 if pair[0] == '1' else 0)
-                    else:
-                        # Odd bit at end
-                        logical_values.append(int(state[i]))
-            else:
-                # Single bit state
-                logical_values.append(int(state))
-            break  # Only decode top state once
-        
-        # Calculate metrics - adapt to actual state width
-        bit_width = len(top_state) if top_state else 2
+        dominance, top_state, is_decohered = calculate_dominance(counts, shots)
+        
+        # Decode straight from the dominant state; no pass over counts
+        logical_values = _decode_logical(top_state) if counts else []
+        
+        # Calculate metrics - adapt to actual state width ("??" placeholder
+        # is 2 wide, the old default, when there is nothing to analyze)
+        bit_width = len(top_state)
         num_states = 2 ** bit_width
         
-        # Generate all possible states for this width
-        all_states = [format(i, f'0{bit_width}b') for i in range(num_states)]
-        obs_dist = np.array([counts.get(k, 0) for k in all_states])
+        # Dense distribution over all states of this width, scattered from the
+        # observed keys in one bincount (never enumerates the 2^n state strings)
+        keys = [k for k in counts if len(k) == bit_width]
+        idx = np.fromiter((int(k, 2) for k in keys), dtype=np.int64, count=len(keys))
+        vals = np.fromiter((counts[k] for k in keys), dtype=np.float64, count=len(keys))
+        obs_dist = np.bincount(idx, weights=vals, minlength=num_states)
         obs_prob = obs_dist / max(shots, 1)
         
         # Purity (trace of rho^2)
-        purity = float(np.sum(obs_prob ** 2))
+        purity = float(obs_prob @ obs_prob)
         
-        # Hellinger distance from uniform
-        uniform_prob = np.ones(num_states) / num_states
-        h_dist = hellinger_distance(obs_prob, uniform_prob)
+        # Hellinger distance from uniform, fused: sqrt(1/N) is a scalar, so no
+        # uniform array; the sqrt buffer is reused for the difference
+        sqrt_u, null_mean, null_std = _uniform_constants(num_states)
+        diff = np.sqrt(obs_prob)
+        diff -= sqrt_u
+        h_dist = math.sqrt(0.5 * float(diff @ diff))
         
         # Z-Score (based on null distribution - scaled for state count)
-        # These constants are for 2-qubit, scale for others
-        NULL_MEAN = 0.008 * (4 / num_states)
-        NULL_STD = 0.0037 * (4 / num_states)
-        z_score = (h_dist - NULL_MEAN) / max(NULL_STD, 0.001)
+        z_score = (h_dist - null_mean) / null_std
         
         return GambitResult(
             counts=counts,
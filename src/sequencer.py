@@ -10,11 +10,19 @@ The sequencer enforces:
     3. Operation ordering (no interrupts during braid)
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+import copy
+from array import array
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from dataclasses import dataclass
 from enum import Enum, auto
+import numpy as np
+
+# .cylinder pulls in Qiskit; it is only needed to raise GeometryError and
+# to annotate compile(), so it is imported on use
+if TYPE_CHECKING:
+    from .cylinder import Cylinder
 
-from .cylinder import Cylinder, UnitCell, GeometryError
 from .isa import TopologyConstants
 
 
@@ -30,14 +38,25 @@ class OpType(Enum):
     BARRIER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     """A sequenced operation in the CTM pipeline."""
     op_type: OpType
     address: Optional[int] = None
     value: Optional[int] = None
     target: Optional[int] = None  # For LINK
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+
+# Sentinel for "no operand" in the Sequencer's columnar operand arrays
+_NONE = -1
+
+# OpType values as stored in the columnar op-type array
+_ALLOC = OpType.ALLOC.value
+_ROTATE = OpType.ROTATE.value
+_LINK = OpType.LINK.value
+_BARRIER = OpType.BARRIER.value
+_READ = OpType.READ.value
 
 
 # =============================================================================
@@ -70,6 +89,13 @@ class Sequencer:
         self.operations: List[Operation] = []
         self._validated = False
         
+        # Columnar copy of the op stream (OpType value / operands, _NONE if
+        # unset) that validate/compile walk instead of the Operation objects
+        self._op_types = array('b')
+        self._addresses = array('i')
+        self._values = array('i')
+        self._targets = array('i')
+        
         # Gray Code transitions
         self.GRAY_TRANSITIONS = {
             (0, 0): [],
@@ -80,7 +106,7 @@ class Sequencer:
     
     def alloc(self, n_disks: int) -> "Sequencer":
         """Queue ALLOC operation."""
-        self.operations.append(Operation(
+        self._append(Operation(
             op_type=OpType.ALLOC,
             value=n_disks
         ))
@@ -93,7 +119,7 @@ class Sequencer:
         
         Uses Gray Code transition if needed.
         """
-        self.operations.append(Operation(
+        self._append(Operation(
             op_type=OpType.ROTATE,
             address=address,
             value=target
@@ -103,7 +129,7 @@ class Sequencer:
     
     def link(self, control: int, target: int) -> "Sequencer":
         """Queue LINK operation."""
-        self.operations.append(Operation(
+        self._append(Operation(
             op_type=OpType.LINK,
             address=control,
             target=target
@@ -113,7 +139,7 @@ class Sequencer:
     
     def read(self, address: int) -> "Sequencer":
         """Queue READ operation."""
-        self.operations.append(Operation(
+        self._append(Operation(
             op_type=OpType.READ,
             address=address
         ))
@@ -122,9 +148,17 @@ class Sequencer:
     
     def barrier(self) -> "Sequencer":
         """Insert a barrier (sync point)."""
-        self.operations.append(Operation(op_type=OpType.BARRIER))
+        self._append(Operation(op_type=OpType.BARRIER))
         return self
     
+    def _append(self, op: Operation) -> None:
+        """Record an operation in both the object list and the columnar arrays."""
+        self.operations.append(op)
+        self._op_types.append(op.op_type.value)
+        self._addresses.append(_NONE if op.address is None else op.address)
+        self._values.append(_NONE if op.value is None else op.value)
+        self._targets.append(_NONE if op.target is None else op.target)
+    
     # =========================================================================
     # VALIDATION
     # =========================================================================
@@ -146,29 +180,54 @@ class Sequencer:
         """
         errors = []
         
-        # Track disk states
-        rotating = set()  # Disks currently in rotation
-        
-        for i, op in enumerate(self.operations):
-            if op.op_type == OpType.ROTATE:
-                if op.address in rotating:
+        if len(self._op_types):
+            types = np.frombuffer(self._op_types, dtype=np.int8)
+            addrs = np.frombuffer(self._addresses, dtype=np.intc).astype(np.int64)
+            tgts = np.frombuffer(self._targets, dtype=np.intc).astype(np.int64)
+            
+            # Barrier-delimited segments (a barrier completes all rotations);
+            # disk state is keyed by (segment, disk) packed into one int.
+            # Disks are shifted by the smallest one so negative addresses
+            # (and the _NONE sentinel) can't alias a neighbouring segment
+            seg = np.cumsum(types == _BARRIER)
+            lo = min(int(addrs.min()), int(tgts.min()))
+            addrs -= lo
+            tgts -= lo
+            stride = max(int(addrs.max()), int(tgts.max())) + 1
+            
+            # A disk rotated again within its segment was interrupted
+            rot_idx = np.flatnonzero(types == _ROTATE)
+            rot_keys = seg[rot_idx] * stride + addrs[rot_idx]
+            rot_uniq, first = np.unique(rot_keys, return_index=True)
+            repeat = np.ones(len(rot_idx), dtype=bool)
+            repeat[first] = False
+            bad_rot = rot_idx[repeat]
+            first_rot = rot_idx[first]  # first rotation per key, aligned with rot_uniq
+            
+            # LINK is unsafe if either disk already rotated earlier in its segment
+            link_idx = np.flatnonzero(types == _LINK)
+            unsafe = np.zeros(len(link_idx), dtype=bool)
+            if len(rot_uniq):
+                for disks in (addrs, tgts):
+                    keys = seg[link_idx] * stride + disks[link_idx]
+                    pos = np.minimum(np.searchsorted(rot_uniq, keys), len(rot_uniq) - 1)
+                    unsafe |= (rot_uniq[pos] == keys) & (first_rot[pos] < link_idx)
+            bad_link = link_idx[unsafe]
+            
+            # Report in op order
+            for i in np.union1d(bad_rot, bad_link).tolist():
+                if types[i] == _ROTATE:
                     errors.append(
-                        f"Op[{i}]: Disk {op.address} rotation interrupted - "
+                        f"Op[{i}]: Disk {addrs[i] + lo} rotation interrupted - "
                         "geometry shattered!"
                     )
-                rotating.add(op.address)
-                
-            elif op.op_type == OpType.BARRIER:
-                rotating.clear()  # Barrier completes all rotations
-                
-            elif op.op_type == OpType.LINK:
-                # Check both disks aren't rotating
-                if op.address in rotating or op.target in rotating:
+                else:
                     errors.append(
                         f"Op[{i}]: LINK during rotation - unsafe state"
                     )
         
         if errors:
+            from .cylinder import GeometryError
             raise GeometryError("\n".join(errors))
         
         self._validated = True
@@ -183,6 +242,7 @@ class Sequencer:
         min_depth = self.complexity * 4  # CZ + RX + RZ + barrier per iteration
         
         if circuit_depth < min_depth:
+            from .cylinder import GeometryError
             raise GeometryError(
                 f"Circuit depth {circuit_depth} < minimum {min_depth}. "
                 "Braid did not complete - geometry shattered!"
@@ -194,7 +254,7 @@ class Sequencer:
     # COMPILATION
     # =========================================================================
     
-    def compile(self, cylinder: Cylinder) -> None:
+    def compile(self, cylinder: "Cylinder") -> None:
         """
         Apply sequenced operations to a cylinder.
         
@@ -204,25 +264,25 @@ class Sequencer:
         if not self._validated:
             self.validate()
         
-        for op in self.operations:
-            if op.op_type == OpType.ALLOC:
+        for op_type, address, value, target in zip(
+                self._op_types, self._addresses, self._values, self._targets):
+            if op_type == _ALLOC:
                 cylinder.alloc()
                 
-            elif op.op_type == OpType.ROTATE:
-                cylinder.rotate(op.address, op.value)
-                
-            elif op.op_type == OpType.LINK:
-                cylinder.link(op.address, op.target)
+            elif op_type == _ROTATE:
+                cylinder.rotate(address, value)
                 
-            elif op.op_type == OpType.READ:
-                pass  # Reads are handled by Needle
+            elif op_type == _LINK:
+                cylinder.link(address, target)
+            
+            # READ: reads are handled by Needle
     
     def get_read_addresses(self) -> List[int]:
         """Get all addresses queued for reading."""
         return [
-            op.address 
-            for op in self.operations 
-            if op.op_type == OpType.READ
+            address
+            for op_type, address in zip(self._op_types, self._addresses)
+            if op_type == _READ
         ]
     
     # =========================================================================
@@ -246,10 +306,23 @@ class Sequencer:
         ops = [op.op_type.name for op in self.operations]
         return f"Sequencer([{', '.join(ops)}])"
     
+    def __copy__(self) -> "Sequencer":
+        """Copy the op stream so the copy can be edited independently."""
+        seq = Sequencer.__new__(Sequencer)
+        seq.__dict__.update(self.__dict__)
+        seq.operations = [copy.copy(op) for op in self.operations]
+        seq._op_types = array('b', self._op_types)
+        seq._addresses = array('i', self._addresses)
+        seq._values = array('i', self._values)
+        seq._targets = array('i', self._targets)
+        return seq
+    
     def clear(self) -> None:
         """Clear all queued operations."""
         self.operations = []
         self._validated = False
+        for column in (self._op_types, self._addresses, self._values, self._targets):
+            del column[:]
 
 
 # =============================================================================
@@ -267,19 +340,34 @@ def quick_sequence(writes: Dict[int, int], links: List[tuple] = None) -> Sequenc
     Returns:
         Configured Sequencer
     """
+    addrs = tuple(sorted(writes))
+    seq = copy.copy(_template_sequencer(addrs, tuple(map(tuple, links or ()))))
+    
+    # ROTATEs lead the stream in address order: patch their values in place
+    for i, addr in enumerate(addrs):
+        value = writes[addr]
+        seq.operations[i].value = value
+        seq._values[i] = value
+    
+    return seq
+
+
+@lru_cache(maxsize=128)
+def _template_sequencer(addrs: tuple, links: tuple) -> Sequencer:
+    """Build the quick_sequence shape for a write/link set, values unset."""
     seq = Sequencer()
     
-    for addr, value in sorted(writes.items()):
-        seq.rotate(addr, value)
+    for addr in addrs:
+        seq.rotate(addr, None)
     
     seq.barrier()
     
-    for ctrl, tgt in (links or []):
+    for ctrl, tgt in links:
         seq.link(ctrl, tgt)
     
     seq.barrier()
     
-    for addr in sorted(writes.keys()):
+    for addr in addrs:
         seq.read(addr)
     
     return seq
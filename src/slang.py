@@ -12,12 +12,29 @@ Syntax:
         result = measure(<name>);
 """
 
-from typing import List, Tuple, Dict, Any, Optional
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum, auto
 
 from .isa import Instruction, OpCode
 
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+
+# Compiled SLangProgram circuits, keyed by complexity + instruction content
+_COMPILED_CACHE_SIZE = 128
+_compiled_cache: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
+
+
+def _instruction_key(instr: Instruction) -> tuple:
+    """Hashable content key for an Instruction (metadata may be a dict)."""
+    meta = tuple(sorted(instr.metadata.items())) if instr.metadata else None
+    return (instr.opcode, instr.target, instr.operands, meta)
+
 
 # =============================================================================
 # S-LANG AST NODES
@@ -52,39 +69,75 @@ class ProgramAST:
     statements: List[ASTNode]
     
     def to_instructions(self) -> List[Instruction]:
-        """Convert AST to G-ISA instructions."""
-        instructions = []
+        """
+        Convert AST to G-ISA instructions.
+        
+        Each statement is lowered through _LOWERERS (node types without a
+        lowering, like PROGRAM and ASSIGNMENT, emit nothing).
+        """
+        instructions: List[Instruction] = []
+        emit = instructions.append
+        lowerers = _LOWERERS
         
         for stmt in self.statements:
-            if stmt.type == ASTNodeType.SOLITON_DECL:
-                name, value = stmt.value
-                instructions.append(Instruction.alloc(name))
-                if value == "H":
-                    instructions.append(Instruction(OpCode.S_WRITE, name, ["H"]))
-                elif isinstance(value, int):
-                    instructions.append(Instruction.write(name, value))
-            
-            elif stmt.type == ASTNodeType.ROLL_CALL:
-                name = stmt.value
-                instructions.append(Instruction.roll(name))
-            
-            elif stmt.type == ASTNodeType.ENTANGLE_CALL:
-                control, target = stmt.value
-                instructions.append(Instruction.cnot(control, target))
-            
-            elif stmt.type == ASTNodeType.MEASURE_CALL:
-                target, result_var = stmt.value
-                instr = Instruction.measure(target)
-                instr.metadata['result_var'] = result_var
-                instructions.append(instr)
+            lower = lowerers.get(stmt.type)
+            if lower is not None:
+                lower(emit, stmt.value)
         
         return instructions
 
 
+def _lower_decl(emit, value) -> None:
+    name, init = value
+    emit(Instruction.alloc(name))
+    if init == "H":
+        emit(Instruction(OpCode.S_WRITE, name, ("H",)))
+    elif isinstance(init, int):
+        emit(Instruction.write(name, init))
+
+
+def _lower_roll(emit, name) -> None:
+    emit(Instruction.roll(name))
+
+
+def _lower_entangle(emit, value) -> None:
+    control, target = value
+    emit(Instruction.cnot(control, target))
+
+
+def _lower_measure(emit, value) -> None:
+    target, result_var = value
+    emit(Instruction.measure(target, result_var))
+
+
+# ASTNodeType -> lowering into G-ISA instructions
+_LOWERERS = {
+    ASTNodeType.SOLITON_DECL: _lower_decl,
+    ASTNodeType.ROLL_CALL: _lower_roll,
+    ASTNodeType.ENTANGLE_CALL: _lower_entangle,
+    ASTNodeType.MEASURE_CALL: _lower_measure,
+}
+
+
 # =============================================================================
 # S-LANG QUICK PARSER
 # =============================================================================
 
+# One pattern for every statement form, anchored at line starts. A line
+# that matches none of them (blank, comment, unknown) is skipped by the
+# search; lastgroup (the last group that closed) names the alternative.
+# [^\S\n] is whitespace that stays on the current line.
+_STATEMENT_RE = re.compile(r"""
+    ^[^\S\n]*(?:
+        program\ [^\S\n]*(?P<program>\w+)[^\S\n]*:
+      | soliton\ [^\S\n]*(?P<sol_name>\w+)[^\S\n]*=[^\S\n]*(?P<soliton>\w+)
+      | (?P<roll>\w+)\.roll\(\)
+      | entangle\([^\S\n]*(?P<ent_ctrl>\w+)[^\S\n]*,[^\S\n]*(?P<entangle>\w+)[^\S\n]*\)
+      | (?P<meas_var>\w+)[^\S\n]*=[^\S\n]*measure[^\S\n]*\([^\S\n]*(?P<measure>\w+)[^\S\n]*\)
+    )
+""", re.MULTILINE | re.VERBOSE)
+
+
 def parse_slang(source: str) -> ProgramAST:
     """
     Quick parser for S-Lang source.
@@ -95,71 +148,46 @@ def parse_slang(source: str) -> ProgramAST:
     Returns:
         ProgramAST
     """
-    import re
-    
-    lines = source.strip().split('\n')
     program_name = "Unnamed"
     statements: List[ASTNode] = []
     
-    for line in lines:
-        line = line.strip()
-        
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
-            continue
+    # Single pass over the whole source
+    for match in _STATEMENT_RE.finditer(source):
+        kind = match.lastgroup
         
         # Program declaration
-        if line.startswith('program '):
-            match = re.match(r'program\s+(\w+)\s*:', line)
-            if match:
-                program_name = match.group(1)
-            continue
+        if kind == 'program':
+            program_name = match['program']
         
         # Soliton declaration: soliton name = value;
-        if line.startswith('soliton '):
-            match = re.match(r'soliton\s+(\w+)\s*=\s*(\w+)\s*;?', line)
-            if match:
-                name = match.group(1)
-                value_str = match.group(2)
-                if value_str == 'H':
-                    value = 'H'
-                else:
-                    value = int(value_str)
-                statements.append(ASTNode(
-                    type=ASTNodeType.SOLITON_DECL,
-                    value=(name, value)
-                ))
-            continue
+        elif kind == 'soliton':
+            value_str = match['soliton']
+            value = 'H' if value_str == 'H' else int(value_str)
+            statements.append(ASTNode(
+                type=ASTNodeType.SOLITON_DECL,
+                value=(match['sol_name'], value)
+            ))
         
         # Roll call: name.roll();
-        if '.roll()' in line:
-            match = re.match(r'(\w+)\.roll\(\)\s*;?', line)
-            if match:
-                statements.append(ASTNode(
-                    type=ASTNodeType.ROLL_CALL,
-                    value=match.group(1)
-                ))
-            continue
+        elif kind == 'roll':
+            statements.append(ASTNode(
+                type=ASTNodeType.ROLL_CALL,
+                value=match['roll']
+            ))
         
         # Entangle: entangle(a, b);
-        if line.startswith('entangle('):
-            match = re.match(r'entangle\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)\s*;?', line)
-            if match:
-                statements.append(ASTNode(
-                    type=ASTNodeType.ENTANGLE_CALL,
-                    value=(match.group(1), match.group(2))
-                ))
-            continue
+        elif kind == 'entangle':
+            statements.append(ASTNode(
+                type=ASTNodeType.ENTANGLE_CALL,
+                value=(match['ent_ctrl'], match['entangle'])
+            ))
         
         # Measure: result = measure(name);
-        if 'measure(' in line:
-            match = re.match(r'(\w+)\s*=\s*measure\s*\(\s*(\w+)\s*\)\s*;?', line)
-            if match:
-                statements.append(ASTNode(
-                    type=ASTNodeType.MEASURE_CALL,
-                    value=(match.group(2), match.group(1))
-                ))
-            continue
+        else:
+            statements.append(ASTNode(
+                type=ASTNodeType.MEASURE_CALL,
+                value=(match['measure'], match['meas_var'])
+            ))
     
     return ProgramAST(name=program_name, statements=statements)
 
@@ -171,6 +199,8 @@ def parse_slang(source: str) -> ProgramAST:
 class SolitonVar:
     """Represents a soliton variable for fluent API."""
     
+    __slots__ = ('name', '_program')
+    
     def __init__(self, name: str, program: "SLangProgram"):
         self.name = name
         self._program = program
@@ -216,12 +246,14 @@ class SLangProgram:
         Returns:
             SolitonVar for method chaining
         """
-        self._add_instruction(Instruction.alloc(name))
-        
+        # ALLOC and its initial WRITE land in one extend
+        alloc = Instruction.alloc(name)
         if value == "H":
-            self._add_instruction(Instruction(OpCode.S_WRITE, name, ["H"]))
+            self._instructions += (alloc, Instruction(OpCode.S_WRITE, name, ("H",)))
         elif isinstance(value, int):
-            self._add_instruction(Instruction.write(name, value))
+            self._instructions += (alloc, Instruction.write(name, value))
+        else:
+            self._instructions.append(alloc)
         
         var = SolitonVar(name, self)
         self._solitons[name] = var
@@ -238,7 +270,7 @@ class SLangProgram:
         Returns:
             Self for chaining
         """
-        self._add_instruction(Instruction.cnot(control.name, target.name))
+        self._instructions.append(Instruction.cnot(control.name, target.name))
         return self
     
     def measure(self, soliton: SolitonVar, result_var: str = None) -> "SLangProgram":
@@ -252,10 +284,7 @@ class SLangProgram:
         Returns:
             Self for chaining
         """
-        instr = Instruction.measure(soliton.name)
-        if result_var:
-            instr.metadata['result_var'] = result_var
-        self._add_instruction(instr)
+        self._instructions.append(Instruction.measure(soliton.name, result_var))
         return self
     
     def _add_instruction(self, instr: Instruction):
@@ -265,7 +294,7 @@ class SLangProgram:
         """Get all generated instructions."""
         return self._instructions.copy()
     
-    def compile(self, complexity: int = 6):
+    def compile(self, complexity: int = 6) -> "QuantumCircuit":
         """
         Compile to quantum circuit.
         
@@ -273,43 +302,69 @@ class SLangProgram:
             complexity: Braid complexity
             
         Returns:
-            QuantumCircuit
+            QuantumCircuit (a copy; the compiled original is cached)
         """
-        from .compiler import CircuitCompiler
-        
-        cc = CircuitCompiler(complexity=complexity)
-        circuit = cc.compile(self._instructions)
+        key = (complexity, tuple(map(_instruction_key, self._instructions)))
+        cached = _compiled_cache.get(key)
+        if cached is None:
+            from .compiler import CircuitCompiler
+            cached = CircuitCompiler(complexity=complexity).compile(self._instructions)
+            _compiled_cache[key] = cached
+            if len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+                _compiled_cache.popitem(last=False)
+        else:
+            _compiled_cache.move_to_end(key)
+        circuit = cached.copy()
         circuit.name = self.name
         return circuit
     
     def to_slang(self) -> str:
         """Convert to S-Lang source code."""
         lines = [f"program {self.name}:"]
+        lappend = lines.append
+        emitters = _TO_SLANG
         
+        # Opcodes without an emitter (S_ALLOC: the following WRITE declares
+        # the soliton) produce no line
         for instr in self._instructions:
-            if instr.opcode == OpCode.S_ALLOC:
-                # Find the following WRITE to get the value
-                continue
-            elif instr.opcode == OpCode.S_WRITE:
-                value = instr.operands[0]
-                lines.append(f"    soliton {instr.target} = {value};")
-            elif instr.opcode == OpCode.S_ROLL:
-                lines.append(f"    {instr.target}.roll();")
-            elif instr.opcode == OpCode.S_CNOT:
-                control = instr.operands[0]
-                lines.append(f"    entangle({control}, {instr.target});")
-            elif instr.opcode == OpCode.S_MEASURE:
-                result_var = instr.metadata.get('result_var', 'result')
-                lines.append(f"    {result_var} = measure({instr.target});")
+            emit = emitters.get(instr.opcode)
+            if emit is not None:
+                lappend(emit(instr))
         
         return '\n'.join(lines)
 
 
+def _slang_write(instr: Instruction) -> str:
+    return f"    soliton {instr.target} = {instr.operands[0]};"
+
+
+def _slang_roll(instr: Instruction) -> str:
+    return f"    {instr.target}.roll();"
+
+
+def _slang_cnot(instr: Instruction) -> str:
+    return f"    entangle({instr.operands[0]}, {instr.target});"
+
+
+def _slang_measure(instr: Instruction) -> str:
+    result_var = (instr.metadata or {}).get('result_var', 'result')
+    return f"    {result_var} = measure({instr.target});"
+
+
+# OpCode -> S-Lang source line
+_TO_SLANG = {
+    OpCode.S_WRITE: _slang_write,
+    OpCode.S_ROLL: _slang_roll,
+    OpCode.S_CNOT: _slang_cnot,
+    OpCode.S_MEASURE: _slang_measure,
+}
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-def compile_from_source(source: str, complexity: int = 6):
+def compile_from_source(source: str, complexity: int = 6) -> "QuantumCircuit":
     """
     Compile S-Lang source to quantum circuit.
     
@@ -321,7 +376,6 @@ def compile_from_source(source: str, complexity: int = 6):
         QuantumCircuit
     """
     from .compiler import GambitCompiler
-    
     compiler = GambitCompiler(complexity=complexity)
     _, circuit = compiler.compile_source(source)
     return circuit
@@ -334,6 +388,11 @@ def quick_bell_state():
     Returns:
         Compiled QuantumCircuit for |00⟩ + |11⟩
     """
+    return _bell_state_circuit().copy()
+
+
+@lru_cache(maxsize=1)
+def _bell_state_circuit():
     prog = SLangProgram("BellState")
     alpha = prog.soliton("alpha", "H")
     beta = prog.soliton("beta", 0)
@@ -350,6 +409,11 @@ def quick_soliton_roll():
     Returns:
         Compiled QuantumCircuit demonstrating logical NOT
     """
+    return _soliton_roll_circuit().copy()
+
+
+@lru_cache(maxsize=1)
+def _soliton_roll_circuit():
     prog = SLangProgram("SolitonRoll")
     q = prog.soliton("q", 0)
     q.roll()
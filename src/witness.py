@@ -9,13 +9,15 @@ Implements 3-Disk Parity with:
     - Fault injection integration
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Optional, Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Optional, Literal, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 from .fault_engine import FaultEngine
 
 
-class ParityWitness:
+class ParityWitness(BraidWitness):
     """
     LockWorks v6.0: 3-Disk Parity with Fault Detection.
     
@@ -29,16 +31,20 @@ class ParityWitness:
         This aligns with ibm_fez native topology.
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         """
         Initialize Parity Witness.
         
         Args:
             complexity: Braid layers (C parameter)
+            emit_barriers: Barrier after every braid layer. If False, only
+                one barrier closes each disk's braid (smaller circuit, but
+                the transpiler may then merge braid layers).
         """
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')  # 3 Disks × 2 qubits
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers
+        self.q = Q  # 3 Disks × 2 qubits
+        self.c = C
         self.qc = QuantumCircuit(self.q, self.c)
         
         # Data qubit indices (odd indices per CTM spec)
@@ -67,85 +73,93 @@ class ParityWitness:
         Returns:
             The constructed QuantumCircuit
         """
-        # Reset circuit
-        self.qc = QuantumCircuit(self.q, self.c)
+        self.qc = self._bound(
+            val_a, val_b, inject_fault, fault_target, basis, use_baseline
+        ).copy()
+        return self.qc
+    
+    def _build_template(
+        self, 
+        inject_fault: bool,
+        fault_target: int,
+        basis: Literal['Z', 'X'],
+        use_baseline: bool
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
+        qc = QuantumCircuit(self.q, self.c)
         
         # === LAYER 1: OPEN PORTAL ===
-        self.qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === LAYER 2: HARDEN DATA DISKS ===
         if use_baseline:
             # Depth-matched identity (no topology)
             FaultEngine.noise_baseline(
-                self.qc, 
+                qc, 
                 [self.q[i] for i in range(4)],  # Disk 0 and 1 qubits
                 self.complexity * 3  # Match gate count roughly
             )
         else:
-            self._braid_disk(0, val_a)
-            self._braid_disk(1, val_b)
+            self._braid_disk(qc, 0, self.theta_a)
+            self._braid_disk(qc, 1, self.theta_b)
         
         # === LAYER 3: GEAR-SYNC (Corrected Direction) ===
         # Inverted CX: CX(target=parity, control=source)
-        self.qc.barrier()
+        qc.barrier()
         
         # LINK(0, 2): Parity <- Disk 0
-        self.qc.cx(self.q[5], self.q[1])
+        qc.cx(self.q[5], self.q[1])
         
         # LINK(1, 2): Parity <- Disk 1
-        self.qc.cx(self.q[5], self.q[3])
+        qc.cx(self.q[5], self.q[3])
         
-        self.qc.barrier()
+        qc.barrier()
         
         # === LAYER 4: LOCK PARITY DISK ===
         if use_baseline:
             FaultEngine.noise_baseline(
-                self.qc,
+                qc,
                 [self.q[4], self.q[5]],
                 self.complexity * 3
             )
         else:
-            self._braid_disk(2, 0)  # Parity disk starts at ROBUST
+            self._braid_disk(qc, 2, 0.0)  # Parity disk starts at ROBUST
         
         # === LAYER 5: FAULT INJECTION ===
         if inject_fault:
             target_qubit = self.data_indices[fault_target]
-            FaultEngine.inject_bit_flip(self.qc, self.q[target_qubit])
+            FaultEngine.inject_bit_flip(qc, self.q[target_qubit])
         
         # === LAYER 6: SEAL & MEASURE ===
         if basis == 'X':
             # X-basis: Apply H only to data qubits before measure
-            self.qc.barrier()
+            qc.barrier()
             for idx in self.data_indices:
-                self.qc.h(self.q[idx])
+                qc.h(self.q[idx])
         elif basis == 'Z':
             # Z-basis: Global H closure (standard CTM)
-            self.qc.h(self.q)
+            qc.compose(PORTAL, inplace=True)
         
         # Measure data bits
-        self.qc.measure(self.q[1], self.c[0])   # Disk 0
-        self.qc.measure(self.q[3], self.c[1])   # Disk 1
-        self.qc.measure(self.q[5], self.c[2])   # Parity
+        qc.measure(self.q[1], self.c[0])   # Disk 0
+        qc.measure(self.q[3], self.c[1])   # Disk 1
+        qc.measure(self.q[5], self.c[2])   # Parity
         
-        return self.qc
+        return qc
     
-    def _braid_disk(self, disk_idx: int, value: int) -> None:
+    def _braid_disk(self, 
+                    qc: QuantumCircuit, 
+                    disk_idx: int, 
+                    theta: Union[float, Parameter]) -> None:
         """
         Apply braid kernel to a disk.
         
         Args:
+            qc: Circuit to append to
             disk_idx: Disk index (0, 1, or 2)
-            value: Target value (0 = ROBUST, 1 = FISHER)
+            theta: Braid angle (0.0 = ROBUST, 0.196 = FISHER) or a Parameter
         """
-        theta = 0.196 if value == 1 else 0.0
-        p = disk_idx * 2      # Phase qubit (even)
-        d = disk_idx * 2 + 1  # Data qubit (odd)
-        
-        for _ in range(self.complexity):
-            self.qc.cz(self.q[p], self.q[d])
-            self.qc.rx(theta, self.q[p])
-            self.qc.rz(theta * 2, self.q[d])
-            self.qc.barrier([self.q[p], self.q[d]])
+        braid(qc, self.q, disk_idx, theta, self.complexity, self.emit_barriers)
     
     def get_circuit(self) -> QuantumCircuit:
         """Return the current circuit."""
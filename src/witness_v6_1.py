@@ -13,11 +13,14 @@ Key Metric:
     High SVR (>10) = Fault-Absorbing Manifold confirmed
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Literal, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 
-class WitnessV6:
+
+class WitnessV6(BraidWitness):
     """
     LockWorks v6.1: Attractor Verification.
     
@@ -26,10 +29,11 @@ class WitnessV6:
         - Mid faults are absorbed (state returns to attractor)
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers  # False: one barrier per braid
+        self.q = Q
+        self.c = C
     
     def build_test_circuit(
         self, 
@@ -53,15 +57,23 @@ class WitnessV6:
         Returns:
             Configured QuantumCircuit
         """
+        return self._bound(val_a, val_b, fault_mode, basis).copy()
+    
+    def _build_template(
+        self, 
+        fault_mode: Literal['NONE', 'MID', 'LATE'],
+        basis: Literal['Z', 'X']
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
         qc = QuantumCircuit(self.q, self.c)
         data_indices = [1, 3, 5]  # A, B, P
         
         # === 1. OPEN PORTAL ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 2. HARDEN DATA DISKS ===
-        self._braid(qc, 0, val_a)
-        self._braid(qc, 1, val_b)
+        self._braid(qc, 0, self.theta_a)
+        self._braid(qc, 1, self.theta_b)
         
         # === 3. GEAR-SYNC (Inverted CX: Parity <- Data) ===
         qc.barrier()
@@ -70,7 +82,7 @@ class WitnessV6:
         qc.barrier()
         
         # === 4. LOCK PARITY DISK ===
-        self._braid(qc, 2, 0)  # Parity starts at ROBUST
+        self._braid(qc, 2, 0.0)  # Parity starts at ROBUST
         
         # === 5. MID FAULT INJECTION ===
         # Inject while manifold is still "soft" (post-braid, pre-seal)
@@ -87,7 +99,7 @@ class WitnessV6:
                 qc.h(self.q[idx])
         else:
             # Z-basis: Global H closure
-            qc.h(self.q)
+            qc.compose(PORTAL, inplace=True)
         
         # === 7. LATE FAULT INJECTION ===
         # Inject after seal, just before measurement
@@ -103,14 +115,6 @@ class WitnessV6:
         
         return qc
     
-    def _braid(self, qc: QuantumCircuit, idx: int, val: int) -> None:
+    def _braid(self, qc: QuantumCircuit, idx: int, theta: Union[float, Parameter]) -> None:
         """Apply braid kernel to disk."""
-        theta = 0.196 if val == 1 else 0.0
-        p = idx * 2      # Phase qubit
-        d = idx * 2 + 1  # Data qubit
-        
-        for _ in range(self.complexity):
-            qc.cz(self.q[p], self.q[d])
-            qc.rx(theta, self.q[p])
-            qc.rz(theta * 2, self.q[d])
-            qc.barrier([self.q[p], self.q[d]])
+        braid(qc, self.q, idx, theta, self.complexity, self.emit_barriers)
@@ -16,21 +16,25 @@ If SVR_matched = Syndrome(LATE-Z) / Syndrome(MID-X) > 10:
     The manifold actively absorbs faults, not just hides them.
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Literal, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 
-class WitnessV62:
+
+class WitnessV62(BraidWitness):
     """
     LockWorks v6.2: Frame-Matched Fault Injection.
     
     Implements MID-X vs LATE-Z comparison to defeat the HXH=Z critique.
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers  # False: one barrier per braid
+        self.q = Q
+        self.c = C
     
     def build_test_circuit(
         self, 
@@ -53,15 +57,23 @@ class WitnessV62:
                 'LATE_Z': Z after Seal (frame-matched to MID_X)
             settle_cycles: Extra identity cycles between MID fault and seal
         """
+        return self._bound(val_a, val_b, fault_mode, settle_cycles).copy()
+    
+    def _build_template(
+        self, 
+        fault_mode: Literal['NONE', 'MID_X', 'MID_Z', 'LATE_X', 'LATE_Z'],
+        settle_cycles: int
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
         qc = QuantumCircuit(self.q, self.c)
         data_indices = [1, 3, 5]
         
         # === 1. OPEN PORTAL ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 2. HARDEN DATA DISKS ===
-        self._braid(qc, 0, val_a)
-        self._braid(qc, 1, val_b)
+        self._braid(qc, 0, self.theta_a)
+        self._braid(qc, 1, self.theta_b)
         
         # === 3. GEAR-SYNC ===
         qc.barrier()
@@ -70,7 +82,7 @@ class WitnessV62:
         qc.barrier()
         
         # === 4. LOCK PARITY ===
-        self._braid(qc, 2, 0)
+        self._braid(qc, 2, 0.0)
         
         # === 5. MID FAULT INJECTION ===
         if fault_mode == 'MID_X':
@@ -88,7 +100,7 @@ class WitnessV62:
             qc.barrier()
         
         # === 6. SEAL ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 7. LATE FAULT INJECTION ===
         if fault_mode == 'LATE_X':
@@ -107,13 +119,5 @@ class WitnessV62:
         
         return qc
     
-    def _braid(self, qc: QuantumCircuit, idx: int, val: int) -> None:
-        theta = 0.196 if val == 1 else 0.0
-        p = idx * 2
-        d = idx * 2 + 1
-        
-        for _ in range(self.complexity):
-            qc.cz(self.q[p], self.q[d])
-            qc.rx(theta, self.q[p])
-            qc.rz(theta * 2, self.q[d])
-            qc.barrier([self.q[p], self.q[d]])
+    def _braid(self, qc: QuantumCircuit, idx: int, theta: Union[float, Parameter]) -> None:
+        braid(qc, self.q, idx, theta, self.complexity, self.emit_barriers)
@@ -12,11 +12,14 @@ Key Insight:
 If SVR_X > 10: The manifold absorbs phase faults too (3D Attractor)
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Literal, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 
-class WitnessV63:
+
+class WitnessV63(BraidWitness):
     """
     LockWorks v6.3: X-Basis Phase Detection.
     
@@ -24,11 +27,17 @@ class WitnessV63:
     Proves the manifold is a 3D topological sink, not a 1D pump.
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers  # False: one barrier per braid
+        self.q = Q
+        self.c = C
         self.data_indices = [1, 3, 5]
+        
+        # H on every data qubit, composed wherever the circuit changes basis
+        self._x_basis_rot = QuantumCircuit(6, name='x_basis')
+        for idx in self.data_indices:
+            self._x_basis_rot.h(idx)
     
     def build_test_circuit(
         self, 
@@ -46,14 +55,21 @@ class WitnessV63:
             val_a, val_b: Input values
             fault_mode: Type of fault to inject
         """
+        return self._bound(val_a, val_b, fault_mode).copy()
+    
+    def _build_template(
+        self, 
+        fault_mode: Literal['NONE', 'MID_X', 'MID_Z', 'LATE_X', 'LATE_Z']
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
         qc = QuantumCircuit(self.q, self.c)
         
         # === 1. OPEN PORTAL ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 2. HARDEN DATA DISKS ===
-        self._braid(qc, 0, val_a)
-        self._braid(qc, 1, val_b)
+        self._braid(qc, 0, self.theta_a)
+        self._braid(qc, 1, self.theta_b)
         
         # === 3. GEAR-SYNC (Inverted CX) ===
         qc.barrier()
@@ -62,7 +78,7 @@ class WitnessV63:
         qc.barrier()
         
         # === 4. LOCK PARITY ===
-        self._braid(qc, 2, 0)
+        self._braid(qc, 2, 0.0)
         
         # === 5. MID FAULT (Pre-Seal) ===
         if fault_mode == 'MID_X':
@@ -75,7 +91,7 @@ class WitnessV63:
             qc.barrier()
         
         # === 6. SEAL (Global H) ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 7. LATE FAULT (Post-Seal) ===
         if fault_mode == 'LATE_X':
@@ -91,8 +107,7 @@ class WitnessV63:
         # Apply H to data qubits to measure in X-basis
         # This makes Z-errors visible as bit flips
         qc.barrier()
-        for idx in self.data_indices:
-            qc.h(self.q[idx])
+        qc.compose(self._x_basis_rot, inplace=True)
         
         # === 9. MEASURE ===
         qc.measure(self.q[1], self.c[0])
@@ -101,13 +116,5 @@ class WitnessV63:
         
         return qc
     
-    def _braid(self, qc: QuantumCircuit, idx: int, val: int) -> None:
-        theta = 0.196 if val == 1 else 0.0
-        p = idx * 2
-        d = idx * 2 + 1
-        
-        for _ in range(self.complexity):
-            qc.cz(self.q[p], self.q[d])
-            qc.rx(theta, self.q[p])
-            qc.rz(theta * 2, self.q[d])
-            qc.barrier([self.q[p], self.q[d]])
+    def _braid(self, qc: QuantumCircuit, idx: int, theta: Union[float, Parameter]) -> None:
+        braid(qc, self.q, idx, theta, self.complexity, self.emit_barriers)
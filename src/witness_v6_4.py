@@ -16,11 +16,14 @@ When we measure in X-basis with X-parity encoding:
 This kills the "phase-blindness" critique.
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Literal, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 
-class WitnessV64:
+
+class WitnessV64(BraidWitness):
     """
     LockWorks v6.4: Phase Stabilizer Witness.
     
@@ -28,11 +31,17 @@ class WitnessV64:
     Makes phase errors (Z) visible in X-basis measurement.
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers  # False: one barrier per braid
+        self.q = Q
+        self.c = C
         self.data_indices = [1, 3, 5]
+        
+        # H on every data qubit, composed wherever the circuit changes basis
+        self._x_basis_rot = QuantumCircuit(6, name='x_basis')
+        for idx in self.data_indices:
+            self._x_basis_rot.h(idx)
     
     def build_phase_protected_circuit(
         self, 
@@ -50,14 +59,21 @@ class WitnessV64:
             val_a, val_b: Input values (0 = ROBUST, 1 = FISHER)
             fault_mode: NONE, MID_Z (phase fault before lock), LATE_Z (after lock)
         """
+        return self._bound(val_a, val_b, fault_mode).copy()
+    
+    def _build_template(
+        self, 
+        fault_mode: Literal['NONE', 'MID_Z', 'LATE_Z']
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
         qc = QuantumCircuit(self.q, self.c)
         
         # === 1. OPEN PORTAL - Initialize to |+⟩ ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 2. HARDEN DATA DISKS ===
-        self._braid(qc, 0, val_a)
-        self._braid(qc, 1, val_b)
+        self._braid(qc, 0, self.theta_a)
+        self._braid(qc, 1, self.theta_b)
         
         # === 3. X-PARITY LINK (H-Conjugated) ===
         # H-CX-H transforms Z-parity CNOT into X-parity CZ-like behavior
@@ -65,16 +81,14 @@ class WitnessV64:
         qc.barrier()
         
         # Rotate data qubits to Z-basis
-        for idx in self.data_indices:
-            qc.h(self.q[idx])
+        qc.compose(self._x_basis_rot, inplace=True)
         
         # Apply CNOT (now acts on Z-basis, encoding X-parity)
         qc.cx(self.q[5], self.q[1])  # Parity <- Disk A
         qc.cx(self.q[5], self.q[3])  # Parity <- Disk B
         
         # Rotate back to X-basis
-        for idx in self.data_indices:
-            qc.h(self.q[idx])
+        qc.compose(self._x_basis_rot, inplace=True)
         
         qc.barrier()
         
@@ -85,7 +99,7 @@ class WitnessV64:
             qc.barrier()
         
         # === 5. LOCK PARITY DISK ===
-        self._braid(qc, 2, 0)  # Parity at ROBUST
+        self._braid(qc, 2, 0.0)  # Parity at ROBUST
         
         # === 6. LATE PHASE FAULT (Post-Lock Z) ===
         if fault_mode == 'LATE_Z':
@@ -96,8 +110,7 @@ class WitnessV64:
         # === 7. X-BASIS MEASUREMENT ===
         # Rotate to X-basis to detect phase errors as bit flips
         qc.barrier()
-        for idx in self.data_indices:
-            qc.h(self.q[idx])
+        qc.compose(self._x_basis_rot, inplace=True)
         
         # Measure
         qc.measure(self.q[1], self.c[0])
@@ -106,13 +119,5 @@ class WitnessV64:
         
         return qc
     
-    def _braid(self, qc: QuantumCircuit, idx: int, val: int) -> None:
-        theta = 0.196 if val == 1 else 0.0
-        p = idx * 2
-        d = idx * 2 + 1
-        
-        for _ in range(self.complexity):
-            qc.cz(self.q[p], self.q[d])
-            qc.rx(theta, self.q[p])
-            qc.rz(theta * 2, self.q[d])
-            qc.barrier([self.q[p], self.q[d]])
+    def _braid(self, qc: QuantumCircuit, idx: int, theta: Union[float, Parameter]) -> None:
+        braid(qc, self.q, idx, theta, self.complexity, self.emit_barriers)
@@ -17,11 +17,14 @@ Key Insight:
     by applying the topological sink AFTER the fault.
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Literal
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from typing import Iterable, List, Literal, Tuple, Union
 
+from ._braid_kernel import BraidWitness, C, PORTAL, Q, braid
 
-class WitnessV65:
+
+class WitnessV65(BraidWitness):
     """
     LockWorks v6.5: Phase-Locked Loop.
     
@@ -29,11 +32,16 @@ class WitnessV65:
     Tests if the Braid can actively correct phase errors.
     """
     
-    def __init__(self, complexity: int = 6):
+    def __init__(self, complexity: int = 6, emit_barriers: bool = True):
         self.complexity = complexity
-        self.q = QuantumRegister(6, 'q')
-        self.c = ClassicalRegister(3, 'meas')
+        self.emit_barriers = emit_barriers  # False: one barrier per braid
+        self.q = Q
+        self.c = C
         self.data_indices = [1, 3, 5]
+        
+        # Steps 1-2 (OPEN + X-LINK) are the same for every build; each
+        # template starts from a copy
+        self._prelude = self._build_prelude()
     
     def build_pll_circuit(
         self, 
@@ -56,10 +64,28 @@ class WitnessV65:
             val_a, val_b: Disk values (for braid theta)
             fault_mode: NONE, MID_Z (pre-braid), LATE_Z (post-braid)
         """
+        return self._bound(val_a, val_b, fault_mode).copy()
+    
+    def build_sweep(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        modes: Iterable[Literal['NONE', 'MID_Z', 'LATE_Z']] = ('NONE', 'MID_Z', 'LATE_Z')
+    ) -> List[QuantumCircuit]:
+        """
+        Build PLL circuits for every (val_a, val_b) pair × fault mode.
+        
+        Ordered pair-major, so the whole sweep can go out as one
+        multi-PUB job (NeedleDriver.read_batch).
+        """
+        modes = tuple(modes)
+        return [self.build_pll_circuit(a, b, m) for a, b in pairs for m in modes]
+    
+    def _build_prelude(self) -> QuantumCircuit:
+        """Steps 1-2 (OPEN + X-LINK), shared by every option set."""
         qc = QuantumCircuit(self.q, self.c)
         
         # === 1. OPEN PORTAL ===
-        qc.h(self.q)
+        qc.compose(PORTAL, inplace=True)
         
         # === 2. X-PARITY LINK (Immediate Gearing) ===
         # Establish X-correlation FIRST, before any hardening
@@ -74,6 +100,15 @@ class WitnessV65:
             qc.h(self.q[idx])
         qc.barrier()
         
+        return qc
+    
+    def _build_template(
+        self, 
+        fault_mode: Literal['NONE', 'MID_Z', 'LATE_Z']
+    ) -> QuantumCircuit:
+        """Circuit for one option set, with the disk A/B braid angles unbound."""
+        qc = self._prelude.copy()
+        
         # === 3. MID PHASE FAULT (Pre-Braid) ===
         # Inject Z error BEFORE the braid
         # If PLL works, the braid should "heal" this error
@@ -84,9 +119,9 @@ class WitnessV65:
         
         # === 4. TOPOLOGICAL HARDENING (The Shield) ===
         # Apply Braid AFTER link AND fault to heal phase errors
-        self._braid(qc, 0, val_a)
-        self._braid(qc, 1, val_b)
-        self._braid(qc, 2, 0)  # Parity lock at ROBUST
+        self._braid(qc, 0, self.theta_a)
+        self._braid(qc, 1, self.theta_b)
+        self._braid(qc, 2, 0.0)  # Parity lock at ROBUST
         
         # === 5. LATE PHASE FAULT (Post-Braid) ===
         # Inject Z error AFTER the braid
@@ -106,14 +141,6 @@ class WitnessV65:
         
         return qc
     
-    def _braid(self, qc: QuantumCircuit, idx: int, val: int) -> None:
+    def _braid(self, qc: QuantumCircuit, idx: int, theta: Union[float, Parameter]) -> None:
         """Apply braid kernel to a disk."""
-        theta = 0.196 if val == 1 else 0.0
-        p = idx * 2
-        d = idx * 2 + 1
-        
-        for _ in range(self.complexity):
-            qc.cz(self.q[p], self.q[d])
-            qc.rx(theta, self.q[p])
-            qc.rz(theta * 2, self.q[d])
-            qc.barrier([self.q[p], self.q[d]])
+        braid(qc, self.q, idx, theta, self.complexity, self.emit_barriers)
@@ -1,41 +1,58 @@
 import numpy as np
 import os
 import json
+import hashlib
 import logging
-from qiskit import QuantumCircuit
+import struct
+import tempfile
+from functools import lru_cache
+import qiskit
+from qiskit import QuantumCircuit, qasm2, qpy
+from qiskit.circuit import Parameter
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 # --- SIGMA CONFIG ---
 SHOT_COUNTS = [1024, 4096, 8192] 
 COMPLEXITY = 6
+OPT_LEVEL = 3
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lockworks", "transpile")
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger()
 
 # --- AUTH ---
-TOKEN = os.environ.get("QISKIT_IBM_TOKEN")
-try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    key_path = os.path.join(script_dir, "apikey.json")
-    if os.path.exists(key_path):
-        with open(key_path, "r") as f:
-            data = json.load(f)
-            if "apikey" in data:
-                TOKEN = data["apikey"]
-                logger.info("🔑 Loaded token from apikey.json")
-except Exception as e:
-    pass
-
-if not TOKEN:
-    raise ValueError("Need QISKIT_IBM_TOKEN or apikey.json")
+@lru_cache(maxsize=1)
+def _load_token():
+    # Environment wins; apikey.json is only read (once) when it is unset
+    token = os.environ.get("QISKIT_IBM_TOKEN")
+    if token:
+        return token
+    try:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        key_path = os.path.join(script_dir, "apikey.json")
+        if os.path.exists(key_path):
+            with open(key_path, "r") as f:
+                data = json.load(f)
+                if "apikey" in data:
+                    logger.info("🔑 Loaded token from apikey.json")
+                    return data["apikey"]
+    except Exception as e:
+        pass
+    return None
 
 # --- THE GRAY CODE ISA ---
 class GambitGrayQubit:
-    def __init__(self, name="Q_GRAY"):
+    def __init__(self, name="Q_GRAY", emit_barriers=True):
         self.name = name
+        # False: one barrier after the braid instead of one per iteration
+        self.emit_barriers = emit_barriers
         self.theta = 0.0
         self.complexity = COMPLEXITY
+        # Only theta changes between levels: the braid is built once with a
+        # placeholder angle and compile() binds the current theta into it
+        self.theta_param = Parameter('θ')
+        self._template = None
         
     def to_gray(self, n):
         return n ^ (n >> 1)
@@ -53,21 +70,80 @@ class GambitGrayQubit:
         return self.theta, gray_val
 
     def compile(self):
-        qc = QuantumCircuit(2)
+        if self._template is None:
+            qc = QuantumCircuit(2)
+            qc.h([0, 1]) 
+            for _ in range(self.complexity):
+                qc.cz(0, 1)
+                qc.rx(self.theta_param, 0)
+                qc.rz(self.theta_param * 2, 1)
+                if self.emit_barriers:
+                    qc.barrier()
+            if not self.emit_barriers:
+                qc.barrier()
+            qc.h([0, 1]) 
+            qc.measure_all()
+            self._template = qc
+        # Bound before transpiling, so L3 can still drop rx(0)/rz(0) at ROBUST
+        qc = self._template.assign_parameters({self.theta_param: self.theta})
         qc.name = f"{self.name}_th_{self.theta:.3f}"
-        qc.h([0, 1]) 
-        for _ in range(self.complexity):
-            qc.cz(0, 1)
-            qc.rx(self.theta, 0)
-            qc.rz(self.theta * 2, 1)
-            qc.barrier()
-        qc.h([0, 1]) 
-        qc.measure_all()
         return qc
 
+# --- TRANSPILE CACHE ---
+@lru_cache(maxsize=None)
+def _pass_manager(backend):
+    return generate_preset_pass_manager(backend=backend, optimization_level=OPT_LEVEL)
+
+def _target_digest(backend):
+    """Digest of the backend Target: every instruction, its qargs and calibration."""
+    target = backend.target
+    h = hashlib.sha256(str(target.num_qubits).encode())
+    for name in sorted(target.operation_names):
+        for qargs, props in sorted(target[name].items(), key=lambda kv: repr(kv[0])):
+            h.update(repr((
+                name, qargs,
+                getattr(props, "error", None), getattr(props, "duration", None)
+            )).encode())
+    return h.hexdigest()
+
+def _transpile_cached(backend, qc):
+    """Transpile qc for backend, reusing the on-disk (QPY) result of an earlier run."""
+    # Same backend calibration + same source circuit + same qiskit -> same ISA circuit
+    key = "|".join((
+        backend.name,
+        str(getattr(backend, "backend_version", "")),
+        _target_digest(backend),
+        qiskit.__version__,
+        str(OPT_LEVEL),
+        qasm2.dumps(qc),
+    ))
+    path = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + ".qpy")
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                return qpy.load(f)[0]
+        except (OSError, ValueError, struct.error, qpy.QpyError) as e:
+            logger.warning(f"⚠️ Discarding unreadable transpile cache entry {path}: {e}")
+
+    isa_qc = _pass_manager(backend).run(qc)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write to a temp file and rename, so a crash never leaves a torn entry
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            qpy.dump(isa_qc, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return isa_qc
+
 # --- EXECUTION ---
 def run_stress_test():
-    service = QiskitRuntimeService(token=TOKEN)
+    token = _load_token()
+    if not token:
+        raise ValueError("Need QISKIT_IBM_TOKEN or apikey.json")
+    service = QiskitRuntimeService(token=token)
     backend = service.least_busy(operational=True, simulator=False)
     logger.info(f"🚀 Target: {backend.name} | Scanning for Shot Sweet Spot...")
 
@@ -83,9 +159,8 @@ def run_stress_test():
         qc.metadata = {"level": level, "gray": gray, "theta": theta}
         circuits.append(qc)
 
-    # 2. Transpile ONCE
-    pm = generate_preset_pass_manager(backend=backend, optimization_level=3)
-    isa_circuits = pm.run(circuits)
+    # 2. Transpile ONCE (per backend revision; warm runs load from CACHE_DIR)
+    isa_circuits = [_transpile_cached(backend, qc) for qc in circuits]
 
     # 3. Submit Multi-Shot Batch (FIXED: Flatten the list)
     sampler = Sampler(mode=backend)
@@ -130,8 +205,11 @@ def run_stress_test():
             # Metadata
             theta = circuits[level].metadata['theta']
             
-            sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-            top_state, top_count = sorted_counts[0]
+            # Argmax over the count vector (ties: first state, as before)
+            states = list(counts)
+            vals = np.fromiter(counts.values(), dtype=np.int64, count=len(states))
+            i = int(vals.argmax())
+            top_state, top_count = states[i], int(vals[i])
             dominance = top_count / shots_used
             
             # Sigma Grading
@@ -31,11 +31,14 @@ from src.needle import NeedleDriver
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 
 
-def build_4disk_swap_circuit(complexity: int = 6) -> QuantumCircuit:
+def build_4disk_swap_circuit(complexity: int = 6,
+                             emit_barriers: bool = True) -> QuantumCircuit:
     """
     Build a 4-disk circuit with inter-core LINK.
     
     Uses v3.2 Anchor Sequence with inverted CX.
+    With emit_barriers=False each braid gets one closing barrier instead of
+    one per iteration, so the transpiler can fuse its layers.
     """
     # 4 disks = 8 qubits (2 per disk)
     qreg = QuantumRegister(8, 'q')
@@ -63,6 +66,9 @@ def build_4disk_swap_circuit(complexity: int = 6) -> QuantumCircuit:
         qc.cz(qreg[p], qreg[d])
         qc.rx(theta, qreg[p])
         qc.rz(theta * 2, qreg[d])
+        if emit_barriers:
+            qc.barrier([qreg[p], qreg[d]])
+    if not emit_barriers:
         qc.barrier([qreg[p], qreg[d]])
     
     # === LAYER 3: INTER-CORE LINK (1 → 2) with inverted CX ===
@@ -79,6 +85,9 @@ def build_4disk_swap_circuit(complexity: int = 6) -> QuantumCircuit:
             qc.cz(qreg[p], qreg[d])
             qc.rx(theta, qreg[p])
             qc.rz(theta * 2, qreg[d])
+            if emit_barriers:
+                qc.barrier([qreg[p], qreg[d]])
+        if not emit_barriers:
             qc.barrier([qreg[p], qreg[d]])
     
     # === LAYER 5: SEAL ===
@@ -123,12 +132,11 @@ def test_4disk_swap():
     
     # Check inter-core correlation
     # Expected: Disk 1 and Disk 2 should correlate
+    # Disk 1 is bit 1, Disk 2 is bit 2 (2nd/3rd from right); equal bits XOR to 0
     d1_d2_corr = 0
     for state, count in counts.items():
-        bits = state.zfill(4)
-        d1 = int(bits[-2])  # Disk 1 (2nd from right)
-        d2 = int(bits[-3])  # Disk 2 (3rd from right)
-        if d1 == d2:  # Correlated
+        s = int(state, 2)
+        if not ((s >> 1) ^ (s >> 2)) & 1:  # Correlated
             d1_d2_corr += count
     
     corr_pct = d1_d2_corr / total
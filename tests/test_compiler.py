@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.isa import (
     OpCode, 
     Instruction, 
+    Program,
     SolitonRegister, 
     SolitonHeap,
     TopologyConstants,
@@ -22,6 +23,7 @@ from src.isa import (
     from_gray,
     gray_code_transition,
     decode_physical_to_logical,
+    decode_many,
     calculate_dominance,
 )
 from src.compiler import (
@@ -64,7 +66,7 @@ class TestInstruction(unittest.TestCase):
     def test_write_instruction(self):
         instr = Instruction.write("q", 0)
         self.assertEqual(instr.opcode, OpCode.S_WRITE)
-        self.assertEqual(instr.operands, [0])
+        self.assertEqual(instr.operands, (0,))
     
     def test_write_invalid_value(self):
         with self.assertRaises(ValueError):
@@ -78,7 +80,46 @@ class TestInstruction(unittest.TestCase):
         instr = Instruction.cnot("ctrl", "tgt")
         self.assertEqual(instr.opcode, OpCode.S_CNOT)
         self.assertEqual(instr.target, "tgt")
-        self.assertEqual(instr.operands, ["ctrl"])
+        self.assertEqual(instr.operands, ("ctrl",))
+
+
+class TestProgram(unittest.TestCase):
+    """Test the columnar Program view."""
+    
+    def test_from_instructions(self):
+        prog = Program.from_instructions([
+            Instruction.alloc("a"),
+            Instruction.alloc("b"),
+            Instruction(OpCode.S_WRITE, "a", ("H",)),
+            Instruction.cnot("a", "b"),
+            Instruction.measure("b", "r"),
+        ])
+        self.assertEqual(len(prog), 5)
+        self.assertEqual(prog.names, ["a", "b"])
+        self.assertEqual(prog.indices(OpCode.S_ALLOC).tolist(), [0, 1])
+        self.assertEqual(prog.op0[2], Program.SUPERPOSITION)
+        self.assertEqual(prog.names[prog.op0[3]], "a")
+        self.assertEqual(prog.metadata, {4: {'result_var': 'r'}})
+    
+    def test_missing_operand(self):
+        with self.assertRaises(ValueError):
+            Program.from_instructions([
+                Instruction.alloc("a"),
+                Instruction.alloc("b"),
+                Instruction(OpCode.S_CNOT, "a"),
+            ])
+    
+    def test_run(self):
+        heap = SolitonHeap()
+        Program.from_instructions([
+            Instruction.alloc("a"),
+            Instruction.alloc("b"),
+            Instruction.write("a", 1),
+            Instruction.roll("b"),
+            Instruction.roll("a"),
+        ]).run(heap)
+        self.assertEqual(heap.get("a").logical_state, 0)
+        self.assertEqual(heap.get("b").logical_state, 1)
 
 
 class TestSolitonRegister(unittest.TestCase):
@@ -106,6 +147,27 @@ class TestSolitonRegister(unittest.TestCase):
         self.assertEqual(reg.theta, TopologyConstants.THETA_FISHER)
         reg.roll()
         self.assertEqual(reg.theta, TopologyConstants.THETA_ROBUST)
+    
+    def test_validation_switch(self):
+        # python -O wins over GAMBIT_VALIDATE; without it the env var decides
+        import subprocess
+        
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        probe = "import src.isa; print(src.isa._VALIDATE)"
+        for flags, env_value, expected in (
+            ([], None, "True"),
+            ([], "0", "False"),
+            (["-O"], "1", "False"),
+        ):
+            env = dict(os.environ)
+            env.pop("GAMBIT_VALIDATE", None)
+            if env_value is not None:
+                env["GAMBIT_VALIDATE"] = env_value
+            out = subprocess.run(
+                [sys.executable, *flags, "-c", probe],
+                cwd=root, env=env, capture_output=True, text=True, check=True,
+            ).stdout.split()[-1]
+            self.assertEqual(out, expected, (flags, env_value))
 
 
 class TestSolitonHeap(unittest.TestCase):
@@ -176,6 +238,9 @@ class TestDecoding(unittest.TestCase):
         self.assertEqual(decode_physical_to_logical('10'), 1)
         self.assertEqual(decode_physical_to_logical('11'), 1)
     
+    def test_decode_many(self):
+        self.assertEqual(decode_many([0b00, 0b01, 0b10, 0b11]).tolist(), [0, 0, 1, 1])
+    
     def test_dominance_calculation(self):
         counts = {'00': 900, '10': 50, '01': 30, '11': 20}
         dom, top, decoh = calculate_dominance(counts)
@@ -183,6 +248,16 @@ class TestDecoding(unittest.TestCase):
         self.assertEqual(top, '00')
         self.assertAlmostEqual(dom, 0.9, places=2)
         self.assertFalse(decoh)  # 90% > 85% threshold
+    
+    def test_state_table_msb_first(self):
+        from experiments.verify_scaling_law import _state_table, _pair_states
+        
+        for width in (3, 8, 9, 12):
+            rows = [''.join(map(str, row)) for row in _state_table(width).tolist()]
+            self.assertEqual(rows, [format(i, f'0{width}b') for i in range(2**width)])
+        
+        self.assertEqual(_pair_states(5)[:3], ('0000000000', '0000000011', '0000001100'))
+        self.assertEqual(_pair_states(5)[-1], '1' * 10)
 
 
 class TestCompiler(unittest.TestCase):
@@ -215,6 +290,46 @@ class TestCompiler(unittest.TestCase):
         
         self.assertEqual(name, "Bell")
         self.assertEqual(circuit.num_qubits, 4)  # 2 solitons = 4 physical
+    
+    def test_braid_barriers_optional(self):
+        source = """
+        program Test:
+            soliton q = 1;
+            measure(q);
+        """
+        _, with_barriers = GambitCompiler().compile_source(source)
+        _, without = GambitCompiler(emit_barriers=False).compile_source(source)
+        
+        self.assertEqual(with_barriers.count_ops().get('barrier', 0), 6)
+        self.assertEqual(without.count_ops()['barrier'], 1)  # closes the braid
+        self.assertEqual(without.count_ops()['cz'], 6)
+    
+    def test_witness_braid_barriers_optional(self):
+        from src._braid_kernel import braid_block
+        
+        self.assertEqual(braid_block(6, 0.5).count_ops()['barrier'], 6)
+        without = braid_block(6, 0.5, emit_barriers=False)
+        self.assertEqual(without.count_ops()['barrier'], 1)
+        self.assertEqual(without.data[-1].operation.name, 'barrier')
+        self.assertEqual(without.count_ops()['cz'], 6)
+    
+    def test_cylinder_braid_barriers_optional(self):
+        from src.cylinder import Cylinder
+        
+        mem = Cylinder(2)
+        mem.rotate(0, 1)
+        mem.rotate(1, 1)
+        with_barriers = mem.to_circuit()
+        
+        mem = Cylinder(2, emit_barriers=False)
+        mem.rotate(0, 1)
+        mem.rotate(1, 1)
+        without = mem.to_circuit()
+        
+        # One closing barrier per disk braid instead of one per iteration
+        self.assertEqual(with_barriers.count_ops()['barrier'], 2 * 6)
+        self.assertEqual(without.count_ops()['barrier'], 2)
+        self.assertEqual(without.count_ops()['cz'], 2 * 6)
 
 
 class TestSLangProgram(unittest.TestCase):
@@ -229,6 +344,18 @@ class TestSLangProgram(unittest.TestCase):
         instrs = prog.get_instructions()
         self.assertEqual(len(instrs), 4)  # alloc, write, roll, measure
     
+    def test_compile_cache_returns_copies(self):
+        prog = SLangProgram("First")
+        prog.measure(prog.soliton("q", 1))
+        first = prog.compile()
+        first.x(0)
+        
+        other = SLangProgram("Second")
+        other.measure(other.soliton("q", 1))
+        second = other.compile()
+        self.assertEqual(second.name, "Second")
+        self.assertEqual(len(second.data), len(first.data) - 1)
+    
     def test_bell_state_helper(self):
         circuit = quick_bell_state()
         self.assertEqual(circuit.num_qubits, 4)
@@ -250,6 +377,10 @@ class TestGISAAssembler(unittest.TestCase):
         self.assertEqual(len(instrs), 4)
         self.assertEqual(instrs[0].opcode, OpCode.S_ALLOC)
         self.assertEqual(instrs[2].opcode, OpCode.S_ROLL)
+    
+    def test_unknown_opcode(self):
+        with self.assertRaises(SyntaxError):
+            GISAAssembler().assemble("S_ALLOC q\nS_TELEPORT q")
 
 
 class TestLexer(unittest.TestCase):
@@ -265,6 +396,27 @@ class TestLexer(unittest.TestCase):
         self.assertEqual(tokens[1].type, TokenType.IDENTIFIER)
 
 
+class TestGearbox(unittest.TestCase):
+    """Test Gearbox link layers."""
+    
+    def test_link_layer_matches_single_links(self):
+        from qiskit import QuantumCircuit
+        from src.gearbox import Gearbox
+        
+        pairs = [(1, 3), (3, 5), (7, 1)]
+        single = QuantumCircuit(8)
+        for ctrl, tgt in pairs:
+            Gearbox.engage_cold_link(single, ctrl, tgt)
+        
+        layer = QuantumCircuit(8)
+        Gearbox.engage_cold_links(layer, [
+            (layer.qubits[ctrl], layer.qubits[tgt]) for ctrl, tgt in pairs
+        ])
+        
+        self.assertEqual(layer, single)
+        self.assertEqual(layer.count_ops()['barrier'], 2 * len(pairs))
+
+
 if __name__ == "__main__":
     # Run with verbose output
     unittest.main(verbosity=2)
@@ -138,6 +138,24 @@ class TestSequencer(unittest.TestCase):
         
         self.assertTrue(seq.validate())
     
+    def test_validation_negative_addresses(self):
+        """Negative addresses don't alias disks of another segment."""
+        seq = Sequencer()
+        seq.rotate(2, 1)
+        seq.barrier()
+        seq.rotate(-1, 1)
+        seq.link(2, -1)
+        
+        with self.assertRaises(GeometryError):
+            seq.validate()
+        
+        seq = Sequencer()
+        seq.rotate(2, 1)
+        seq.barrier()
+        seq.rotate(-1, 1)
+        
+        self.assertTrue(seq.validate())
+    
     def test_quick_sequence(self):
         """Quick sequence builder."""
         seq = quick_sequence(
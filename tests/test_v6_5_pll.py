@@ -68,10 +68,12 @@ def run_pll_test():
         ("LATE_Z", "LATE-Z (Post-Braid, Should Be VISIBLE)"),
     ]
     
-    for mode, desc in tests:
+    # All fault modes go out as one job
+    circuits = witness.build_sweep([(val_a, val_b)], [mode for mode, _ in tests])
+    readings = needle.read_batch(circuits)
+    
+    for (mode, desc), res in zip(tests, readings):
         print(f"\n📍 {desc}")
-        qc = witness.build_pll_circuit(val_a, val_b, fault_mode=mode)
-        res = needle.read_circuit(qc)
         analysis = calculate_x_syndrome(res.raw_counts)
         results.append({"mode": mode, "desc": desc, **analysis, "counts": res.raw_counts})
         print(f"   Top State: |{analysis['top_state']}⟩")